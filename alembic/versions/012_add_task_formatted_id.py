@@ -0,0 +1,39 @@
+"""Add generated formatted_id column to tasks
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # "Task-00000042" is computed once on write instead of on every read
+    op.add_column(
+        'tasks',
+        sa.Column(
+            'formatted_id',
+            sa.Text(),
+            sa.Computed(
+                "'Task-' || lpad(task_number::text, greatest(8, length(task_number::text)), '0')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index('ix_tasks_formatted_id', 'tasks', ['formatted_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_formatted_id', table_name='tasks')
+    op.drop_column('tasks', 'formatted_id')
@@ -0,0 +1,45 @@
+"""Generate primary key UUIDs server-side
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose UUID primary key was generated client-side with uuid.uuid4
+TABLES = (
+    'users',
+    'oauth_tokens',
+    'user_settings',
+    'conversations',
+    'messages',
+    'persons',
+    'tasks',
+    'note_groups',
+    'notes',
+    'note_items',
+    'inbox_items',
+    'refresh_tokens',
+)
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built into PostgreSQL 13+ (no pgcrypto needed)
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
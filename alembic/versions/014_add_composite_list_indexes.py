@@ -0,0 +1,52 @@
+"""Add composite indexes for list queries
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tasks: user listing ordered by (updated_at, id), optionally by status
+    op.create_index('idx_tasks_user_updated', 'tasks', ['user_id', 'updated_at', 'id'], unique=False)
+    op.create_index('idx_tasks_user_status_updated', 'tasks', ['user_id', 'status', 'updated_at'], unique=False)
+    op.drop_index('ix_tasks_user_id', table_name='tasks')
+    op.drop_index('ix_tasks_status', table_name='tasks')
+
+    # Messages: always fetched per conversation ordered by created_at
+    op.create_index('idx_messages_conv_created', 'messages', ['conversation_id', 'created_at'], unique=False)
+    op.drop_index('ix_messages_conversation_id', table_name='messages')
+
+    # Conversations: most recently updated first per user
+    op.create_index('idx_conversations_user_updated', 'conversations', ['user_id', 'updated_at'], unique=False)
+    op.drop_index('ix_conversations_user_id', table_name='conversations')
+
+    # Inbox: status filter plus created_at ordering per user
+    op.create_index('idx_inbox_items_user_status_created', 'inbox_items', ['user_id', 'status', 'created_at'], unique=False)
+    op.drop_index('idx_inbox_items_user_status', table_name='inbox_items')
+
+
+def downgrade() -> None:
+    op.create_index('idx_inbox_items_user_status', 'inbox_items', ['user_id', 'status'], unique=False)
+    op.drop_index('idx_inbox_items_user_status_created', table_name='inbox_items')
+
+    op.create_index('ix_conversations_user_id', 'conversations', ['user_id'], unique=False)
+    op.drop_index('idx_conversations_user_updated', table_name='conversations')
+
+    op.create_index('ix_messages_conversation_id', 'messages', ['conversation_id'], unique=False)
+    op.drop_index('idx_messages_conv_created', table_name='messages')
+
+    op.create_index('ix_tasks_status', 'tasks', ['status'], unique=False)
+    op.create_index('ix_tasks_user_id', 'tasks', ['user_id'], unique=False)
+    op.drop_index('idx_tasks_user_status_updated', table_name='tasks')
+    op.drop_index('idx_tasks_user_updated', table_name='tasks')
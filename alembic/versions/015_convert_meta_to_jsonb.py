@@ -0,0 +1,43 @@
+"""Convert conversation and message meta columns to JSONB
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Same storage as inbox_items: decomposed JSONB instead of reparsed text
+    for table in ('conversations', 'messages'):
+        op.alter_column(
+            table,
+            'meta',
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using='meta::jsonb',
+        )
+
+
+def downgrade() -> None:
+    for table in ('conversations', 'messages'):
+        op.alter_column(
+            table,
+            'meta',
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using='meta::json',
+        )
@@ -0,0 +1,49 @@
+"""Fill created_at/updated_at server-side in UTC
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Timestamp columns per table that get a server-side insert default
+COLUMNS = {
+    'users': ('created_at', 'updated_at'),
+    'oauth_tokens': ('created_at', 'updated_at'),
+    'user_settings': ('created_at', 'updated_at'),
+    'conversations': ('created_at', 'updated_at'),
+    'messages': ('created_at',),
+    'persons': ('created_at', 'updated_at'),
+    'tasks': ('created_at', 'updated_at'),
+    'note_groups': ('created_at', 'updated_at'),
+    'notes': ('created_at', 'updated_at'),
+    'note_items': ('created_at', 'updated_at'),
+    'inbox_items': ('created_at', 'updated_at'),
+    'refresh_tokens': ('created_at',),
+}
+
+
+def upgrade() -> None:
+    # Columns are timestamp without time zone holding UTC, so pin now() to UTC
+    # instead of relying on the session TimeZone
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    # Back to the defaults created by the original migrations
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=sa.text('now()'))
@@ -0,0 +1,34 @@
+"""Add trigram indexes on person names and note titles
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram GIN indexes let ILIKE (including '%term%') use an index
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'idx_persons_name_trgm', 'persons', ['name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_notes_title_trgm', 'notes', ['title'],
+        unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notes_title_trgm', table_name='notes')
+    op.drop_index('idx_persons_name_trgm', table_name='persons')
@@ -0,0 +1,48 @@
+"""Generate notes.search_vector from title and content
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('dutch', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('dutch', coalesce(content, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # The plain column was never populated; replace it with a stored
+    # generated column so PostgreSQL keeps it in sync on every write
+    op.drop_index('idx_notes_search', table_name='notes')
+    op.drop_column('notes', 'search_vector')
+    op.add_column(
+        'notes',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index('idx_notes_search', 'notes', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notes_search', table_name='notes')
+    op.drop_column('notes', 'search_vector')
+    op.add_column('notes', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.create_index('idx_notes_search', 'notes', ['search_vector'], unique=False, postgresql_using='gin')
@@ -0,0 +1,26 @@
+"""Cache task_number_seq values per session
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '019'
+down_revision: Union[str, None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Each backend reserves 50 numbers at a time; unused ones are skipped
+    # when the connection closes, so task numbers may have gaps
+    op.execute("ALTER SEQUENCE task_number_seq CACHE 50")
+
+
+def downgrade() -> None:
+    op.execute("ALTER SEQUENCE task_number_seq CACHE 1")
@@ -0,0 +1,31 @@
+"""Add GIN index on tasks.tags
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '020'
+down_revision: Union[str, None] = '019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the tags @> ARRAY[...] filter in the task list;
+    # built concurrently so writes to tasks are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_tasks_tags_gin', 'tasks', ['tags'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_tasks_tags_gin', table_name='tasks', postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""Extend list indexes with id for keyset pagination
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '021'
+down_revision: Union[str, None] = '020'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset cursors compare (sort key, id); the trailing id keeps the seek
+    # inside a single index range scan
+    op.drop_index('idx_conversations_user_updated', table_name='conversations')
+    op.create_index('idx_conversations_user_updated', 'conversations', ['user_id', 'updated_at', 'id'], unique=False)
+
+    op.drop_index('idx_messages_conv_created', table_name='messages')
+    op.create_index('idx_messages_conv_created', 'messages', ['conversation_id', 'created_at', 'id'], unique=False)
+
+    op.create_index('idx_persons_user_name', 'persons', ['user_id', 'name', 'id'], unique=False)
+    op.create_index('idx_notes_user_pinned_updated', 'notes', ['user_id', 'is_pinned', 'updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notes_user_pinned_updated', table_name='notes')
+    op.drop_index('idx_persons_user_name', table_name='persons')
+
+    op.drop_index('idx_messages_conv_created', table_name='messages')
+    op.create_index('idx_messages_conv_created', 'messages', ['conversation_id', 'created_at'], unique=False)
+
+    op.drop_index('idx_conversations_user_updated', table_name='conversations')
+    op.create_index('idx_conversations_user_updated', 'conversations', ['user_id', 'updated_at'], unique=False)
@@ -0,0 +1,29 @@
+"""Add trigram index on note content
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '022'
+down_revision: Union[str, None] = '021'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Together with idx_notes_title_trgm (017) the title/content ILIKE search
+    # becomes a BitmapOr of two index scans; pg_trgm was enabled in 017
+    op.create_index(
+        'idx_notes_content_trgm', 'notes', ['content'],
+        unique=False, postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notes_content_trgm', table_name='notes')
@@ -0,0 +1,68 @@
+"""Generate time-ordered UUIDv7 primary keys
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '023'
+down_revision: Union[str, None] = '022'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = (
+    'users',
+    'oauth_tokens',
+    'user_settings',
+    'conversations',
+    'messages',
+    'persons',
+    'tasks',
+    'note_groups',
+    'notes',
+    'note_items',
+    'inbox_items',
+    'refresh_tokens',
+)
+
+
+def upgrade() -> None:
+    # PostgreSQL 15 has no built-in uuidv7(): overlay the 48-bit millisecond
+    # timestamp on a random UUID and flip the version nibble from 4 to 7.
+    # New ids then sort by creation time and land on the right edge of the
+    # primary key B-tree instead of a random leaf page.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('uuid_generate_v7()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
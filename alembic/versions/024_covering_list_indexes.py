@@ -0,0 +1,43 @@
+"""Make person list index covering and note list index partial
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '024'
+down_revision: Union[str, None] = '023'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Persons list selects every column; INCLUDE the rest so it can be
+    # answered with an index-only scan
+    op.drop_index('idx_persons_user_name', table_name='persons')
+    op.create_index(
+        'idx_persons_user_name', 'persons', ['user_id', 'name', 'id'],
+        unique=False, postgresql_include=['email', 'phone_number', 'created_at', 'updated_at'],
+    )
+
+    # Notes list filters out soft-deleted rows by default; leave them out
+    # of the index
+    op.drop_index('idx_notes_user_pinned_updated', table_name='notes')
+    op.create_index(
+        'idx_notes_user_pinned_updated', 'notes', ['user_id', 'is_pinned', 'updated_at', 'id'],
+        unique=False, postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notes_user_pinned_updated', table_name='notes')
+    op.create_index('idx_notes_user_pinned_updated', 'notes', ['user_id', 'is_pinned', 'updated_at', 'id'], unique=False)
+
+    op.drop_index('idx_persons_user_name', table_name='persons')
+    op.create_index('idx_persons_user_name', 'persons', ['user_id', 'name', 'id'], unique=False)
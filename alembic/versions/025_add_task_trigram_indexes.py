@@ -0,0 +1,34 @@
+"""Add trigram indexes on task title and memo
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '025'
+down_revision: Union[str, None] = '024'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # search_tasks ORs title/memo ILIKE '%term%'; with both indexed that
+    # becomes a BitmapOr of two index scans; pg_trgm was enabled in 017
+    op.create_index(
+        'idx_tasks_title_trgm', 'tasks', ['title'],
+        unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_tasks_memo_trgm', 'tasks', ['memo'],
+        unique=False, postgresql_using='gin', postgresql_ops={'memo': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tasks_memo_trgm', table_name='tasks')
+    op.drop_index('idx_tasks_title_trgm', table_name='tasks')
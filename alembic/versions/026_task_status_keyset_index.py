@@ -0,0 +1,38 @@
+"""Add id to the task status list index
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '026'
+down_revision: Union[str, None] = '025'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Status-filtered task lists order by updated_at DESC, id DESC and seek
+    # past an (updated_at, id) cursor; with id in the index the page comes
+    # straight off a backward index scan. The replacement is built before
+    # the old index is dropped, concurrently so writes are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_tasks_user_status_updated_id', 'tasks', ['user_id', 'status', 'updated_at', 'id'],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.drop_index('idx_tasks_user_status_updated', table_name='tasks', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_tasks_user_status_updated', 'tasks', ['user_id', 'status', 'updated_at'],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.drop_index('idx_tasks_user_status_updated_id', table_name='tasks', postgresql_concurrently=True)
@@ -160,9 +160,12 @@ class CalendarEventUseCases:
         Returns:
             Created CalendarEvent
         """
+        # Settings give the primary provider and the timezone for event times
+        settings = self.settings_repo.get_settings(user_id)
+        timezone = settings.timezone if settings else None
+
         # Determine which provider to use
         if provider is None:
-            settings = self.settings_repo.get_settings(user_id)
             provider = settings.primary_calendar_provider if settings else None
 
         if not provider:
@@ -185,13 +188,13 @@ class CalendarEventUseCases:
 
         # Create event in provider
         if provider == "google":
-            service = GoogleCalendarService(access_token)
+            service = GoogleCalendarService(access_token, timezone)
             created_event = await service.create_event(
                 event=event,
                 calendar_id=calendar_id or "primary",
             )
         elif provider == "microsoft":
-            service = MicrosoftCalendarService(access_token)
+            service = MicrosoftCalendarService(access_token, timezone)
             created_event = await service.create_event(
                 event=event,
                 calendar_id=calendar_id,
@@ -230,9 +233,12 @@ class CalendarEventUseCases:
         Returns:
             Updated CalendarEvent
         """
+        # Settings give the primary provider and the timezone for event times
+        settings = self.settings_repo.get_settings(user_id)
+        timezone = settings.timezone if settings else None
+
         # Determine which provider to use
         if provider is None:
-            settings = self.settings_repo.get_settings(user_id)
             provider = settings.primary_calendar_provider if settings else None
 
         if not provider:
@@ -254,14 +260,14 @@ class CalendarEventUseCases:
 
         # Update event in provider
         if provider == "google":
-            service = GoogleCalendarService(access_token)
+            service = GoogleCalendarService(access_token, timezone)
             updated_event = await service.update_event(
                 event_id=event_id,
                 event=event,
                 calendar_id=calendar_id or "primary",
             )
         elif provider == "microsoft":
-            service = MicrosoftCalendarService(access_token)
+            service = MicrosoftCalendarService(access_token, timezone)
             updated_event = await service.update_event(
                 event_id=event_id,
                 event=event,
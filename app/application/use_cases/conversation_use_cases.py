@@ -2,7 +2,7 @@
 Conversation use cases.
 Part of Application layer - orchestrates conversation operations.
 """
-from typing import Optional, List, AsyncIterator
+from typing import Optional, List, AsyncIterator, Tuple
 from uuid import UUID
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
@@ -94,6 +94,7 @@ class ConversationUseCases:
         mode: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Conversation]:
         """
         Get all conversations for a user.
@@ -103,22 +104,19 @@ class ConversationUseCases:
             mode: Optional filter by mode
             limit: Max results
             offset: Offset for pagination
+            after: Keyset cursor (updated_at, id) of the last conversation already seen
 
         Returns:
             List of Conversation entities
         """
-        conversation_models = self.conversation_repo.get_user_conversations(
+        return self.conversation_repo.get_user_conversation_entities(
             user_id=user_id,
             mode=mode,
             limit=limit,
             offset=offset,
+            after=after,
         )
 
-        return [
-            self.conversation_repo.conversation_to_entity(model)
-            for model in conversation_models
-        ]
-
     async def send_message(
         self,
         conversation_id: UUID,
@@ -149,16 +147,14 @@ class ConversationUseCases:
         # Check for commands
         parsed_command = self.command_parser.parse(content)
 
-        # Save user message
-        user_message = self.conversation_repo.add_message(
-            conversation_id=conversation_id,
-            role="user",
-            content=content,
-            metadata={
-                "command": parsed_command.command_type.value if parsed_command.is_command() else None,
-                "command_params": parsed_command.parameters if parsed_command.is_command() else None,
-            },
-        )
+        # Save user message (commands are saved together with their reply below)
+        if not parsed_command.is_command():
+            self.conversation_repo.add_message(
+                conversation_id=conversation_id,
+                role="user",
+                content=content,
+                metadata={"command": None, "command_params": None},
+            )
 
         # Detect widget intent
         widget_intent = await self.widget_service.detect_widget_intent(content)
@@ -168,28 +164,46 @@ class ConversationUseCases:
         if widget_intent.widget_type and widget_intent.confidence >= 0.7:
             widget_data = await self.widget_service.create_widget_for_intent(widget_intent)
 
+        assistant_metadata = {"widget": widget_data} if widget_data else None
+
         # Handle special commands
         if parsed_command.is_command():
             response_content = await self._handle_command(parsed_command, conversation)
+
+            # Save command and assistant response in one insert
+            _, assistant_message = self.conversation_repo.add_messages_bulk(
+                conversation_id=conversation_id,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": content,
+                        "metadata": {
+                            "command": parsed_command.command_type.value,
+                            "command_params": parsed_command.parameters,
+                        },
+                    },
+                    {"role": "assistant", "content": response_content, "metadata": assistant_metadata},
+                ],
+            )
         else:
             # Get AI response
             response_content = await self._get_ai_response(conversation, mode or conversation.mode)
 
-        # Save assistant response (with widget if available)
-        assistant_message = self.conversation_repo.add_message(
-            conversation_id=conversation_id,
-            role="assistant",
-            content=response_content,
-            metadata={"widget": widget_data} if widget_data else None,
-        )
+            # Save assistant response (with widget if available)
+            assistant_message = self.conversation_repo.add_message(
+                conversation_id=conversation_id,
+                role="assistant",
+                content=response_content,
+                metadata=assistant_metadata,
+            )
 
         return Message(
-            id=str(assistant_message.id),
+            id=assistant_message.id,
             conversation_id=assistant_message.conversation_id,
             role=assistant_message.role,
             content=assistant_message.content,
             created_at=assistant_message.created_at,
-            metadata=assistant_message.metadata or {},
+            metadata=assistant_message.meta or {},
         )
 
     async def send_message_stream(
@@ -278,7 +292,7 @@ class ConversationUseCases:
 
     async def _handle_command(self, parsed_command, conversation: Conversation) -> str:
         """Handle special commands."""
-        if parsed_command.command_type == CommandType.HELP:
+        if parsed_command.command_type is CommandType.HELP:
             topic = parsed_command.parameters.get("topic")
             if topic:
                 # Create temp command to get its help text
@@ -286,7 +300,7 @@ class ConversationUseCases:
                 return temp_cmd.get_help_text()
             return parsed_command.get_help_text()
 
-        elif parsed_command.command_type == CommandType.CALENDAR:
+        elif parsed_command.command_type is CommandType.CALENDAR:
             # Use Claude to extract calendar event details from the command
             # Then route through MCP Distributor for test mode support
             try:
@@ -420,7 +434,7 @@ BELANGRIJKE REGELS:
             except Exception as e:
                 return f"❌ Kon de afspraak niet maken: {str(e)}\n\nZorg dat je een kalender hebt gekoppeld in Settings."
 
-        elif parsed_command.command_type == CommandType.REMINDER:
+        elif parsed_command.command_type is CommandType.REMINDER:
             # Reminder is just like calendar but with a simpler message and 5 min duration
             # Routes through MCP Distributor for test mode support
             try:
@@ -517,7 +531,7 @@ Use this as reference for relative dates like "morgen" (tomorrow), "vanavond" (t
             except Exception as e:
                 return f"❌ Kon de herinnering niet maken: {str(e)}\n\nZorg dat je een kalender hebt gekoppeld in Settings."
 
-        elif parsed_command.command_type == CommandType.TASK:
+        elif parsed_command.command_type is CommandType.TASK:
             # Handle task creation
             try:
                 from app.application.use_cases.task_use_cases import TaskUseCases
@@ -563,10 +577,10 @@ Use this as reference for relative dates like "morgen" (tomorrow), "vanavond" (t
             except Exception as e:
                 return f"❌ Kon de taak niet maken: {str(e)}"
 
-        elif parsed_command.command_type == CommandType.NOTE:
+        elif parsed_command.command_type is CommandType.NOTE:
             return "📝 Notitie functie wordt geactiveerd. Wat wil je noteren?\n\n" + parsed_command.get_help_text()
 
-        elif parsed_command.command_type == CommandType.SCAN:
+        elif parsed_command.command_type is CommandType.SCAN:
             return "📸 Scan functie wordt geactiveerd. Upload een document om te scannen.\n\n" + parsed_command.get_help_text()
 
         else:
@@ -836,6 +850,7 @@ KRITIEKE REGELS VOOR PROVIDER SELECTIE:
         user_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Message]:
         """
         Get messages from a conversation.
@@ -845,6 +860,7 @@ KRITIEKE REGELS VOOR PROVIDER SELECTIE:
             user_id: User ID (for authorization)
             limit: Max messages
             offset: Offset for pagination
+            after: Keyset cursor (created_at, id) of the last message already seen
 
         Returns:
             List of Message entities
@@ -858,16 +874,17 @@ KRITIEKE REGELS VOOR PROVIDER SELECTIE:
             conversation_id=conversation_id,
             limit=limit,
             offset=offset,
+            after=after,
         )
 
         return [
             Message(
-                id=str(msg.id),
+                id=msg.id,
                 conversation_id=msg.conversation_id,
                 role=msg.role,
                 content=msg.content,
                 created_at=msg.created_at,
-                metadata=msg.metadata or {},
+                metadata=msg.meta or {},
             )
             for msg in message_models
         ]
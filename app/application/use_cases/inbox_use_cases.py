@@ -78,6 +78,39 @@ class InboxUseCases:
 
         return self._model_to_dict(item_model)
 
+    def create_inbox_items(
+        self,
+        user_id: UUID,
+        items: List[Dict[str, Any]],
+    ) -> List[dict]:
+        """
+        Create many inbox items at once (e.g. a mail sync).
+
+        Args:
+            user_id: User ID
+            items: List of dicts with the create_inbox_item arguments
+                   (type, source, subject, content, raw_data, priority)
+
+        Returns:
+            List of inbox item dicts, in input order
+        """
+        # Validate everything before touching the database
+        entities = [
+            InboxItem.create(
+                user_id=user_id,
+                type=item["type"],
+                source=item["source"],
+                subject=item.get("subject"),
+                content=item.get("content"),
+                raw_data=item.get("raw_data"),
+                priority=item.get("priority", Priority.MEDIUM),
+            )
+            for item in items
+        ]
+
+        item_models = self.inbox_repo.bulk_create_inbox_items(entities)
+        return [self._model_to_dict(model) for model in item_models]
+
     def get_inbox_item(self, item_id: UUID, user_id: UUID) -> Optional[dict]:
         """Get a single inbox item."""
         item_model = self.inbox_repo.get_inbox_item(item_id, user_id)
@@ -257,6 +290,7 @@ Inhoud:
                 priority=suggested_data.get("priority", "medium"),
                 tags=suggested_data.get("tags", []),
                 due_date=suggested_data.get("due_date"),
+                commit=False,
             )
             created_item = {
                 "type": "task",
@@ -272,6 +306,7 @@ Inhoud:
                 content=suggested_data.get("content", item_model.content),
                 categories=suggested_data.get("tags", []),
                 color=suggested_data.get("color", "yellow"),
+                commit=False,
             )
             created_item = {
                 "type": "note",
@@ -282,7 +317,7 @@ Inhoud:
             # Just mark as archived
             pass
 
-        # Update inbox item status
+        # Update inbox item status; commits the created task/note with it
         updated_item = self.inbox_repo.update_inbox_item(
             item_id=item_id,
             user_id=user_id,
@@ -332,6 +367,7 @@ Inhoud:
                 priority=data.get("priority", "medium"),
                 tags=data.get("tags", []),
                 due_date=data.get("due_date"),
+                commit=False,
             )
             created_item = {
                 "type": "task",
@@ -346,13 +382,14 @@ Inhoud:
                 content=data.get("content", item_model.content),
                 categories=data.get("tags", []),
                 color=data.get("color", "yellow"),
+                commit=False,
             )
             created_item = {
                 "type": "note",
                 "id": str(note_model.id),
             }
 
-        # Update inbox item
+        # Update inbox item; commits the created task/note with it
         updated_item = self.inbox_repo.update_inbox_item(
             item_id=item_id,
             user_id=user_id,
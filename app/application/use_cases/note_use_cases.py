@@ -2,7 +2,7 @@
 Note use cases.
 Part of Application layer - orchestrates note management operations.
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -165,9 +165,10 @@ class NoteUseCases:
             is_checklist=note_entity.is_checklist,
             group_id=note_entity.group_id,
             categories=note_entity.categories,
+            commit=not item_entities,
         )
 
-        # Add items if checklist
+        # Add items if checklist; note and items go in one transaction
         if is_checklist and item_entities:
             for item in item_entities:
                 self.note_repo.create_note_item(
@@ -175,7 +176,9 @@ class NoteUseCases:
                     content=item.content,
                     is_checked=item.is_checked,
                     sort_order=item.sort_order,
+                    commit=False,
                 )
+            self.db.commit()
             # Refresh to get items
             note_model = self.note_repo.get_note(note_model.id, user_id)
 
@@ -203,6 +206,7 @@ class NoteUseCases:
         search: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[Tuple[bool, datetime, UUID]] = None,
     ) -> List[dict]:
         """List notes for a user with optional filters."""
         note_models = self.note_repo.get_user_notes(
@@ -212,6 +216,7 @@ class NoteUseCases:
             search=search,
             limit=limit,
             offset=offset,
+            after=after,
         )
         return [self._note_model_to_dict(n) for n in note_models]
 
@@ -2,7 +2,7 @@
 Person use cases.
 Part of Application layer - orchestrates person CRUD operations.
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 
@@ -96,6 +96,7 @@ class PersonUseCases:
         user_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[Tuple[str, UUID]] = None,
     ) -> List[dict]:
         """
         List all persons for a user.
@@ -104,11 +105,12 @@ class PersonUseCases:
             user_id: User ID
             limit: Maximum number of results
             offset: Offset for pagination
+            after: Keyset cursor (name, id) of the last person already seen
 
         Returns:
             List of person dicts
         """
-        persons = self.person_repo.get_user_persons(user_id, limit, offset)
+        persons = self.person_repo.get_user_persons(user_id, limit, offset, after)
 
         return [
             {
@@ -2,7 +2,7 @@
 Task use cases.
 Part of Application layer - orchestrates task management operations.
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -48,24 +48,31 @@ class TaskUseCases:
         Returns:
             Task dict
         """
-        # Resolve delegated_to person if provided
-        delegated_to_id = None
-        if delegated_to_name:
-            person = self.person_repo.find_person_by_name(user_id, delegated_to_name)
-            if person:
-                delegated_to_id = person.id
-
         # Use domain entity for validation
         task_entity = Task.create(
             user_id=user_id,
             title=title,
             memo=memo,
-            delegated_to=delegated_to_id,
             due_date=due_date,
             priority=priority,
             tags=tags,
         )
 
+        # Resolve the delegated person inside the INSERT itself
+        if delegated_to_name:
+            task_model = self.task_repo.create_task_with_delegation(
+                user_id=user_id,
+                title=task_entity.title,
+                delegated_to_name=delegated_to_name,
+                memo=task_entity.memo,
+                due_date=task_entity.due_date,
+                priority=task_entity.priority,
+                status=task_entity.status,
+                status_description=task_entity.status_description,
+                tags=task_entity.tags,
+            )
+            return self._model_to_dict(task_model)
+
         # Create in database
         task_model = self.task_repo.create_task(
             user_id=user_id,
@@ -117,6 +124,24 @@ class TaskUseCases:
 
         return self._model_to_dict(task_model)
 
+    def get_task_by_formatted_id(self, formatted_id: str, user_id: UUID) -> Optional[dict]:
+        """
+        Get a task by formatted ID.
+
+        Args:
+            formatted_id: Formatted task ID (e.g. "Task-00000042")
+            user_id: User ID
+
+        Returns:
+            Task dict or None
+        """
+        task_model = self.task_repo.get_task_by_formatted_id(formatted_id, user_id)
+
+        if not task_model:
+            return None
+
+        return self._model_to_dict(task_model)
+
     def list_tasks(
         self,
         user_id: UUID,
@@ -126,6 +151,7 @@ class TaskUseCases:
         tag: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[dict]:
         """
         List tasks for a user with optional filters.
@@ -138,6 +164,7 @@ class TaskUseCases:
             tag: Filter by tag
             limit: Maximum number of results
             offset: Offset for pagination
+            after: Keyset cursor (updated_at, id) of the last task already seen
 
         Returns:
             List of task dicts
@@ -150,6 +177,7 @@ class TaskUseCases:
             tag=tag,
             limit=limit,
             offset=offset,
+            after=after,
         )
 
         return [self._model_to_dict(t) for t in tasks]
@@ -419,7 +447,7 @@ class TaskUseCases:
         result = {
             "id": str(task_model.id),
             "task_number": task_model.task_number,
-            "formatted_id": f"Task-{task_model.task_number:08d}" if task_model.task_number else None,
+            "formatted_id": task_model.formatted_id,
             "user_id": str(task_model.user_id),
             "title": task_model.title,
             "memo": task_model.memo,
@@ -2,12 +2,26 @@
 Calendar event domain entity.
 Part of Domain layer - contains business logic and rules.
 """
-from dataclasses import dataclass
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Optional
 
 
-@dataclass
+_VALID_PROVIDERS = frozenset({"google", "microsoft"})
+
+# Timezone for event times when the user has no timezone setting
+DEFAULT_TIMEZONE = "Europe/Amsterdam"
+
+
+def _to_epoch(value: datetime) -> int:
+    """Convert a datetime to epoch seconds, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+@dataclass(slots=True)
 class CalendarEvent:
     """
     Calendar event domain entity.
@@ -26,11 +40,22 @@ class CalendarEvent:
     is_all_day: bool = False
     recurrence: Optional[str] = None  # Recurrence rule (RRULE format)
     reminder_minutes: Optional[int] = None  # Minutes before event
+    start_epoch: int = field(init=False, repr=False, compare=False)
+    end_epoch: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.attendees is None:
             self.attendees = []
 
+    def __setattr__(self, name, value):
+        # Keep the cached epochs in sync when start_time/end_time are
+        # assigned, both in __init__ and on later reassignment
+        object.__setattr__(self, name, value)
+        if name == "start_time":
+            object.__setattr__(self, "start_epoch", _to_epoch(value))
+        elif name == "end_time":
+            object.__setattr__(self, "end_epoch", _to_epoch(value))
+
     @classmethod
     def create(
         cls,
@@ -56,7 +81,7 @@ class CalendarEvent:
             raise ValueError("End time must be after start time")
 
         # Validate provider
-        if provider not in ["google", "microsoft"]:
+        if provider not in _VALID_PROVIDERS:
             raise ValueError(f"Invalid provider: {provider}")
 
         return cls(
@@ -81,13 +106,13 @@ class CalendarEvent:
 
     def is_in_future(self) -> bool:
         """Check if event is in the future."""
-        return self.start_time > datetime.utcnow()
+        return self.start_epoch > int(time.time())
 
     def is_in_past(self) -> bool:
         """Check if event is in the past."""
-        return self.end_time < datetime.utcnow()
+        return self.end_epoch < int(time.time())
 
     def is_ongoing(self) -> bool:
         """Check if event is currently ongoing."""
-        now = datetime.utcnow()
-        return self.start_time <= now <= self.end_time
+        now = int(time.time())
+        return self.start_epoch <= now <= self.end_epoch
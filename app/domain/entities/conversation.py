@@ -13,7 +13,7 @@ class Message:
     """
     Single message in a conversation.
     """
-    id: Optional[str]
+    id: Optional[UUID]
     conversation_id: Optional[UUID]
     role: str  # user, assistant, system
     content: str
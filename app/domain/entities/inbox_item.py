@@ -38,7 +38,16 @@ class Priority(str, Enum):
     URGENT = "urgent"
 
 
-@dataclass
+# Statuses that mark an item as handled by the user
+_PROCESSED_STATUSES = frozenset({
+    InboxStatus.ACCEPTED,
+    InboxStatus.MODIFIED,
+    InboxStatus.REJECTED,
+    InboxStatus.ARCHIVED,
+})
+
+
+@dataclass(slots=True, frozen=True)
 class AISuggestion:
     """AI suggestion for processing an inbox item."""
     action: str  # create_task, create_note, create_event, archive, delegate
@@ -48,7 +57,7 @@ class AISuggestion:
     alternative_actions: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LinkedItem:
     """Reference to an item created from inbox."""
     target_type: str  # task, note, event
@@ -97,6 +106,7 @@ class InboxItem:
         if not subject and not content:
             raise ValueError("Inbox item must have either subject or content")
 
+        now = datetime.utcnow()
         return cls(
             id=None,  # Will be set by repository
             user_id=user_id,
@@ -111,8 +121,8 @@ class InboxItem:
             user_decision=None,
             linked_items=[],
             processed_at=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
     def set_ai_suggestion(self, suggestion: Dict[str, Any]) -> None:
@@ -126,54 +136,54 @@ class InboxItem:
         if not self.ai_suggestion:
             raise ValueError("No AI suggestion to accept")
 
+        now = datetime.utcnow()
         self.status = InboxStatus.ACCEPTED
-        self.user_decision = {"action": "accepted", "timestamp": datetime.utcnow().isoformat()}
-        self.processed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.user_decision = {"action": "accepted", "timestamp": now.isoformat()}
+        self.processed_at = now
+        self.updated_at = now
 
     def modify_and_accept(self, modifications: Dict[str, Any]) -> None:
         """Accept with modifications."""
+        now = datetime.utcnow()
         self.status = InboxStatus.MODIFIED
         self.user_decision = {
             "action": "modified",
             "modifications": modifications,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }
-        self.processed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.processed_at = now
+        self.updated_at = now
 
     def reject(self, reason: Optional[str] = None) -> None:
         """Reject the item/suggestion."""
+        now = datetime.utcnow()
         self.status = InboxStatus.REJECTED
         self.user_decision = {
             "action": "rejected",
             "reason": reason,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }
-        self.processed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.processed_at = now
+        self.updated_at = now
 
     def archive(self) -> None:
         """Archive the item without processing."""
+        now = datetime.utcnow()
         self.status = InboxStatus.ARCHIVED
-        self.processed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.processed_at = now
+        self.updated_at = now
 
     def add_linked_item(self, target_type: str, target_id: UUID) -> None:
         """Add a reference to a created item."""
+        now = datetime.utcnow()
         linked_item = {
             "target_type": target_type,
             "target_id": str(target_id),
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": now.isoformat()
         }
         self.linked_items.append(linked_item)
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
 
     def is_processed(self) -> bool:
         """Check if the item has been processed."""
-        return self.status in [
-            InboxStatus.ACCEPTED,
-            InboxStatus.MODIFIED,
-            InboxStatus.REJECTED,
-            InboxStatus.ARCHIVED
-        ]
+        return self.status in _PROCESSED_STATUSES
@@ -2,13 +2,14 @@
 Note domain entity.
 Part of Domain layer - contains business logic and rules.
 """
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteItem:
     """
     NoteItem represents a single item in a checklist note.
@@ -30,17 +31,19 @@ class NoteItem:
         sort_order: int = 0,
     ) -> "NoteItem":
         """Create a new note item."""
-        if not content or len(content.strip()) == 0:
+        stripped = content.strip() if content else ""
+        if not stripped:
             raise ValueError("Note item content cannot be empty")
 
+        now = datetime.utcnow()
         return cls(
             id=None,
             note_id=None,
-            content=content.strip(),
+            content=stripped,
             is_checked=is_checked,
             sort_order=sort_order,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
     def toggle_checked(self) -> None:
@@ -50,14 +53,15 @@ class NoteItem:
 
     def update_content(self, new_content: str) -> None:
         """Update the item content."""
-        if not new_content or len(new_content.strip()) == 0:
+        stripped = new_content.strip() if new_content else ""
+        if not stripped:
             raise ValueError("Note item content cannot be empty")
 
-        self.content = new_content.strip()
+        self.content = stripped
         self.updated_at = datetime.utcnow()
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """
     Note domain entity.
@@ -79,7 +83,8 @@ class Note:
     deleted_at: Optional[datetime] = None
 
     # Valid color values
-    VALID_COLORS = ["yellow", "blue", "red", "green", "purple", "orange", "pink", "gray", "white"]
+    VALID_COLORS = frozenset({"yellow", "blue", "red", "green", "purple", "orange", "pink", "gray", "white"})
+    _COLOR_ERR_SUFFIX = "Must be one of: " + ", ".join(sorted(VALID_COLORS))
 
     @classmethod
     def create(
@@ -102,11 +107,12 @@ class Note:
         if title and len(title) > 500:
             raise ValueError("Note title cannot exceed 500 characters")
 
-        # Validate color
+        # Validate color, then intern it so every stored color shares one string
         if color not in cls.VALID_COLORS:
             raise ValueError(
-                f"Invalid color: {color}. Must be one of: {', '.join(cls.VALID_COLORS)}"
+                f"Invalid color: {color}. {cls._COLOR_ERR_SUFFIX}"
             )
+        color = sys.intern(color)
 
         # If checklist mode, ensure we have items
         if is_checklist and not items:
@@ -116,6 +122,7 @@ class Note:
         if not is_checklist and items:
             raise ValueError("Items can only be added to checklist notes")
 
+        now = datetime.utcnow()
         return cls(
             id=None,  # Will be set by repository
             user_id=user_id,
@@ -127,8 +134,8 @@ class Note:
             is_checklist=is_checklist,
             items=items or [],
             categories=categories or [],
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
             deleted_at=None,
         )
 
@@ -149,8 +156,9 @@ class Note:
         """Update the note color."""
         if new_color not in self.VALID_COLORS:
             raise ValueError(
-                f"Invalid color: {new_color}. Must be one of: {', '.join(self.VALID_COLORS)}"
+                f"Invalid color: {new_color}. {self._COLOR_ERR_SUFFIX}"
             )
+        new_color = sys.intern(new_color)
 
         self.color = new_color
         self.updated_at = datetime.utcnow()
@@ -178,13 +186,18 @@ class Note:
         if not self.is_checklist:
             raise ValueError("Can only remove items from checklist notes")
 
-        self.items = [item for item in self.items if item.id != item_id]
+        # Delete in place instead of rebuilding the list; item ids are unique
+        for index, item in enumerate(self.items):
+            if item.id == item_id:
+                del self.items[index]
+                break
         self.updated_at = datetime.utcnow()
 
     def soft_delete(self) -> None:
         """Soft delete the note."""
-        self.deleted_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.deleted_at = now
+        self.updated_at = now
 
     def restore(self) -> None:
         """Restore a soft-deleted note."""
@@ -2,13 +2,14 @@
 NoteGroup domain entity.
 Part of Domain layer - contains business logic and rules.
 """
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteGroup:
     """
     NoteGroup domain entity.
@@ -25,7 +26,8 @@ class NoteGroup:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Valid color values
-    VALID_COLORS = ["blue", "red", "green", "yellow", "purple", "orange", "pink", "gray"]
+    VALID_COLORS = frozenset({"blue", "red", "green", "yellow", "purple", "orange", "pink", "gray"})
+    _COLOR_ERR_SUFFIX = "Must be one of: " + ", ".join(sorted(VALID_COLORS))
 
     @classmethod
     def create(
@@ -41,50 +43,55 @@ class NoteGroup:
         Enforces business rules at creation time.
         """
         # Validate name
-        if not name or len(name.strip()) == 0:
+        stripped_name = name.strip() if name else ""
+        if not stripped_name:
             raise ValueError("Note group name cannot be empty")
 
         if len(name) > 255:
             raise ValueError("Note group name cannot exceed 255 characters")
 
-        # Validate color
+        # Validate color, then intern it so every stored color shares one string
         if color not in cls.VALID_COLORS:
             raise ValueError(
-                f"Invalid color: {color}. Must be one of: {', '.join(cls.VALID_COLORS)}"
+                f"Invalid color: {color}. {cls._COLOR_ERR_SUFFIX}"
             )
+        color = sys.intern(color)
 
         # Validate icon length if provided
         if icon and len(icon) > 50:
             raise ValueError("Icon cannot exceed 50 characters")
 
+        now = datetime.utcnow()
         return cls(
             id=None,  # Will be set by repository
             user_id=user_id,
-            name=name.strip(),
+            name=stripped_name,
             color=color,
             icon=icon,
             sort_order=sort_order,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
     def update_name(self, new_name: str) -> None:
         """Update the group name."""
-        if not new_name or len(new_name.strip()) == 0:
+        stripped_name = new_name.strip() if new_name else ""
+        if not stripped_name:
             raise ValueError("Note group name cannot be empty")
 
         if len(new_name) > 255:
             raise ValueError("Note group name cannot exceed 255 characters")
 
-        self.name = new_name.strip()
+        self.name = stripped_name
         self.updated_at = datetime.utcnow()
 
     def update_color(self, new_color: str) -> None:
         """Update the group color."""
         if new_color not in self.VALID_COLORS:
             raise ValueError(
-                f"Invalid color: {new_color}. Must be one of: {', '.join(self.VALID_COLORS)}"
+                f"Invalid color: {new_color}. {self._COLOR_ERR_SUFFIX}"
             )
+        new_color = sys.intern(new_color)
 
         self.color = new_color
         self.updated_at = datetime.utcnow()
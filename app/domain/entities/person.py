@@ -2,13 +2,18 @@
 Person domain entity.
 Part of Domain layer - contains business logic and rules.
 """
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 
-@dataclass
+# Basic email shape: local@domain.tld, no whitespace or extra "@"
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+@dataclass(slots=True)
 class Person:
     """
     Person domain entity.
@@ -36,26 +41,27 @@ class Person:
         Enforces business rules at creation time.
         """
         # Validate name
-        if not name or len(name.strip()) == 0:
+        stripped_name = name.strip() if name else ""
+        if not stripped_name:
             raise ValueError("Person name cannot be empty")
 
         if len(name) > 200:
             raise ValueError("Person name cannot exceed 200 characters")
 
         # Validate email if provided
-        if email and len(email.strip()) > 0:
-            email = email.strip()
+        email = email.strip() if email else None
+        if email:
             if len(email) > 255:
                 raise ValueError("Email cannot exceed 255 characters")
             # Basic email validation
-            if "@" not in email or "." not in email.split("@")[-1]:
+            if not _EMAIL_RE.fullmatch(email):
                 raise ValueError("Invalid email format")
         else:
             email = None
 
         # Validate phone number if provided
-        if phone_number and len(phone_number.strip()) > 0:
-            phone_number = phone_number.strip()
+        phone_number = phone_number.strip() if phone_number else None
+        if phone_number:
             if len(phone_number) > 50:
                 raise ValueError("Phone number cannot exceed 50 characters")
         else:
@@ -66,7 +72,7 @@ class Person:
         return cls(
             id=None,  # Will be set by repository
             user_id=user_id,
-            name=name.strip(),
+            name=stripped_name,
             email=email,
             phone_number=phone_number,
             created_at=now,
@@ -81,26 +87,27 @@ class Person:
     ) -> None:
         """Update person details with validation."""
         if name is not None:
-            if not name or len(name.strip()) == 0:
+            stripped_name = name.strip()
+            if not stripped_name:
                 raise ValueError("Person name cannot be empty")
             if len(name) > 200:
                 raise ValueError("Person name cannot exceed 200 characters")
-            self.name = name.strip()
+            self.name = stripped_name
 
         if email is not None:
-            if email and len(email.strip()) > 0:
-                email = email.strip()
+            email = email.strip()
+            if email:
                 if len(email) > 255:
                     raise ValueError("Email cannot exceed 255 characters")
-                if "@" not in email or "." not in email.split("@")[-1]:
+                if not _EMAIL_RE.fullmatch(email):
                     raise ValueError("Invalid email format")
                 self.email = email
             else:
                 self.email = None
 
         if phone_number is not None:
-            if phone_number and len(phone_number.strip()) > 0:
-                phone_number = phone_number.strip()
+            phone_number = phone_number.strip()
+            if phone_number:
                 if len(phone_number) > 50:
                     raise ValueError("Phone number cannot exceed 50 characters")
                 self.phone_number = phone_number
@@ -8,7 +8,7 @@ from typing import Optional, List
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Task domain entity.
@@ -2,12 +2,63 @@
 Command parser service - keyword routing for chat commands.
 Part of Domain layer - business logic for command detection and routing.
 """
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+import re
+from typing import Optional, Dict, Any, Tuple, Callable
+from dataclasses import dataclass, field
 from enum import Enum
 
 
-class CommandType(Enum):
+def _keywords(*words: str) -> "re.Pattern[str]":
+    """Compile a matcher for any of the (lowercase) words (substring match)."""
+    return re.compile("|".join(re.escape(word) for word in words))
+
+
+# Keyword matchers per extractor, in priority order (first match wins)
+_CALENDAR_ACTIONS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("create", _keywords("maak", "plan", "afspraak", "toevoeg")),
+    ("list", _keywords("lijst", "toon", "bekijk", "overzicht")),
+    ("today", _keywords("vandaag", "today")),
+    ("tomorrow", _keywords("morgen", "tomorrow")),
+    ("delete", _keywords("verwijder", "delete", "annuleer")),
+)
+_NOTE_ACTIONS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("create", _keywords("maak", "nieuw", "schrijf")),
+    ("list", _keywords("lijst", "toon", "bekijk")),
+    ("search", _keywords("zoek", "vind", "search")),
+)
+_SCAN_TYPES: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("receipt", _keywords("bon", "receipt")),
+    ("image", _keywords("foto", "image")),
+    ("document", _keywords("document", "pdf")),
+)
+_TIME_CONTEXTS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("today", _keywords("vandaag", "today")),
+    ("tomorrow", _keywords("morgen", "tomorrow")),
+    ("this_week", _keywords("week")),
+    ("this_month", _keywords("maand")),
+)
+
+
+# Task command patterns; extracted values are lowercased, the title keeps its case
+_RE_PERSON = re.compile(r'@(\w+)')
+_RE_PRIORITY = re.compile(r'priority\s+(low|medium|high)', re.IGNORECASE)
+_RE_DEADLINE = re.compile(r'deadline\s+(.+?)(?=\s+priority|\s+tags|\s+@|$)', re.IGNORECASE)
+_RE_TAGS = re.compile(r'tags?\s+([\w,]+)', re.IGNORECASE)
+
+
+def _first_match(
+    matchers: Tuple[Tuple[str, "re.Pattern[str]"], ...],
+    text: str,
+    default: Optional[str],
+) -> Optional[str]:
+    """Return the label of the first matcher found in (lowercased) text."""
+    for label, pattern in matchers:
+        if pattern.search(text):
+            return label
+    return default
+
+
+class CommandType(str, Enum):
     """Available command types."""
     CALENDAR = "calendar"
     REMINDER = "reminder"
@@ -18,24 +69,9 @@ class CommandType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
-class ParsedCommand:
-    """
-    Parsed command result.
-    """
-    command_type: CommandType
-    original_text: str
-    command_text: str  # Text after the command keyword
-    parameters: Dict[str, Any]  # Extracted parameters
-
-    def is_command(self) -> bool:
-        """Check if this is a valid command (not unknown)."""
-        return self.command_type != CommandType.UNKNOWN
-
-    def get_help_text(self) -> str:
-        """Get help text for the command."""
-        help_texts = {
-            CommandType.CALENDAR: """📅 Calendar commando's:
+# Help text per command type (built once at import)
+_HELP_TEXTS: Dict[CommandType, str] = {
+    CommandType.CALENDAR: """📅 Calendar commando's:
 
 #calendar afspraak maken - Maak nieuwe afspraak
 #calendar lijst - Toon komende afspraken
@@ -47,7 +83,7 @@ Voorbeelden:
 - #calendar lijst deze week
 - #calendar verwijder afspraak <id>
 """,
-            CommandType.REMINDER: """⏰ Reminder commando's:
+    CommandType.REMINDER: """⏰ Reminder commando's:
 
 #reminder - Maak een snelle herinnering
 
@@ -56,7 +92,7 @@ Voorbeelden:
 - #reminder Tandarts morgen 10:00
 - #reminder Bel moeder vrijdag 15:00
 """,
-            CommandType.TASK: """✅ Taak commando's:
+    CommandType.TASK: """✅ Taak commando's:
 
 #task of #taak - Maak een nieuwe taak
 
@@ -68,7 +104,7 @@ Voorbeelden:
 
 Gebruik @persoon om een taak te delegeren
 """,
-            CommandType.NOTE: """📝 Notitie commando's:
+    CommandType.NOTE: """📝 Notitie commando's:
 
 #note maken - Nieuwe notitie
 #note lijst - Toon notities
@@ -79,7 +115,7 @@ Voorbeelden:
 - #note lijst vandaag
 - #note zoek vergadering
 """,
-            CommandType.SCAN: """📸 Scan commando's:
+    CommandType.SCAN: """📸 Scan commando's:
 
 #scan document - Scan en verwerk document
 #scan foto - Scan foto/afbeelding
@@ -89,7 +125,7 @@ Voorbeelden:
 - #scan document contract.pdf
 - #scan bon voor declaratie
 """,
-            CommandType.HELP: """❓ Beschikbare commando's:
+    CommandType.HELP: """❓ Beschikbare commando's:
 
 📅 #calendar - Agenda beheer
 ⏰ #reminder - Snelle herinneringen
@@ -101,9 +137,42 @@ Voorbeelden:
 Gebruik #help <commando> voor meer info over een specifiek commando.
 Bijvoorbeeld: #help calendar of #help task
 """,
-        }
+}
 
-        return help_texts.get(self.command_type, "Onbekend commando. Typ #help voor beschikbare commando's.")
+_UNKNOWN_HELP_TEXT = "Onbekend commando. Typ #help voor beschikbare commando's."
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedCommand:
+    """
+    Parsed command result.
+    """
+    command_type: CommandType
+    original_text: str
+    command_text: str  # Text after the command keyword
+    parameters: Dict[str, Any]  # Extracted parameters
+    _is_command: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_is_command", self.command_type is not CommandType.UNKNOWN)
+
+    def is_command(self) -> bool:
+        """Check if this is a valid command (not unknown)."""
+        return self._is_command
+
+    def get_help_text(self) -> str:
+        """Get help text for the command."""
+        return _HELP_TEXTS.get(self.command_type, _UNKNOWN_HELP_TEXT)
+
+
+# Shared result for empty/whitespace-only input (parameters are never exposed
+# for non-commands, so sharing the empty dict is safe)
+_EMPTY_UNKNOWN = ParsedCommand(
+    command_type=CommandType.UNKNOWN,
+    original_text="",
+    command_text="",
+    parameters={},
+)
 
 
 class CommandParser:
@@ -140,8 +209,24 @@ class CommandParser:
         Returns:
             ParsedCommand with detected command and parameters
         """
+        # strip() hands back the same object when there is nothing to strip
         text = text.strip()
+        if not text:
+            return _EMPTY_UNKNOWN
+
+        return cls._parse_stripped(text)
+
+    @classmethod
+    def _parse_stripped(cls, text: str) -> ParsedCommand:
+        """
+        Parse text that has already been stripped of surrounding whitespace.
 
+        Args:
+            text: Stripped user input text
+
+        Returns:
+            ParsedCommand with detected command and parameters
+        """
         # Check if text starts with command prefix
         if not text.startswith(cls.COMMAND_PREFIX):
             return ParsedCommand(
@@ -151,10 +236,17 @@ class CommandParser:
                 parameters={},
             )
 
-        # Extract first word (the command)
-        parts = text.split(maxsplit=1)
-        command_word = parts[0][1:].lower()  # Remove # and lowercase
-        command_text = parts[1] if len(parts) > 1 else ""
+        # Extract first word (the command) without building a split() list
+        space = text.find(" ")
+        command_word = text[1:] if space == -1 else text[1:space]  # Remove #
+        if command_word.isalpha():
+            command_text = "" if space == -1 else text[space + 1:].lstrip()
+        else:
+            # Tabs, newlines or other characters in the first word: let split() decide
+            parts = text.split(maxsplit=1)
+            command_word = parts[0][1:]
+            command_text = parts[1] if len(parts) > 1 else ""
+        command_word = command_word.lower()
 
         # Map to command type
         command_type = cls.COMMAND_KEYWORDS.get(command_word, CommandType.UNKNOWN)
@@ -183,76 +275,53 @@ class CommandParser:
         """
         params = {"raw_text": text}
 
-        if command_type == CommandType.CALENDAR:
-            params.update(cls._extract_calendar_params(text))
-        elif command_type == CommandType.REMINDER:
-            params.update(cls._extract_calendar_params(text))  # Same as calendar
-        elif command_type == CommandType.TASK:
-            params.update(cls._extract_task_params(text))
-        elif command_type == CommandType.NOTE:
-            params.update(cls._extract_note_params(text))
-        elif command_type == CommandType.SCAN:
-            params.update(cls._extract_scan_params(text))
-        elif command_type == CommandType.HELP:
-            params.update(cls._extract_help_params(text))
+        extractor = _EXTRACTORS.get(command_type)
+        if extractor is None:
+            return params
+
+        # Lowercase once for all case-insensitive keyword matching
+        params.update(extractor(text, text.lower()))
 
         return params
 
     @classmethod
-    def _extract_calendar_params(cls, text: str) -> Dict[str, Any]:
+    def _extract_calendar_params(cls, text: str, text_lower: str) -> Dict[str, Any]:
         """Extract calendar-specific parameters."""
-        text_lower = text.lower()
-
-        # Detect action
-        action = "unknown"
-        if any(word in text_lower for word in ["maak", "plan", "afspraak", "toevoeg"]):
-            action = "create"
-        elif any(word in text_lower for word in ["lijst", "toon", "bekijk", "overzicht"]):
-            action = "list"
-        elif any(word in text_lower for word in ["vandaag", "today"]):
-            action = "today"
-        elif any(word in text_lower for word in ["morgen", "tomorrow"]):
-            action = "tomorrow"
-        elif any(word in text_lower for word in ["verwijder", "delete", "annuleer"]):
-            action = "delete"
-
         return {
-            "action": action,
+            "action": _first_match(_CALENDAR_ACTIONS, text_lower, "unknown"),
             "time_context": cls._extract_time_context(text_lower),
         }
 
     @classmethod
-    def _extract_task_params(cls, text: str) -> Dict[str, Any]:
+    def _extract_task_params(cls, text: str, text_lower: str) -> Dict[str, Any]:
         """Extract task-specific parameters including @person delegation."""
-        import re
-
         params = {}
 
         # Extract @person mentions for delegation
-        person_match = re.search(r'@(\w+)', text)
+        person_match = _RE_PERSON.search(text)
         if person_match:
             params["delegated_to"] = person_match.group(1)
             # Remove @person from text for further processing
-            text = re.sub(r'@\w+', '', text)
+            text = _RE_PERSON.sub('', text)
 
         # Extract priority
-        priority_match = re.search(r'priority\s+(low|medium|high)', text.lower())
+        priority_match = _RE_PRIORITY.search(text)
         if priority_match:
-            params["priority"] = priority_match.group(1)
-            text = re.sub(r'priority\s+(low|medium|high)', '', text, flags=re.IGNORECASE)
+            params["priority"] = priority_match.group(1).lower()
+            text = _RE_PRIORITY.sub('', text)
 
         # Extract due date/deadline
-        deadline_match = re.search(r'deadline\s+(.+?)(?:\s+priority|\s+tags|\s+@|$)', text.lower())
+        deadline_match = _RE_DEADLINE.search(text)
         if deadline_match:
-            params["due_date"] = deadline_match.group(1).strip()
-            text = re.sub(r'deadline\s+.+?(?=\s+priority|\s+tags|\s+@|$)', '', text, flags=re.IGNORECASE)
+            params["due_date"] = deadline_match.group(1).strip().lower()
+            text = _RE_DEADLINE.sub('', text)
 
         # Extract tags
-        tags_match = re.search(r'tags?\s+([\w,]+)', text.lower())
+        tags_match = _RE_TAGS.search(text)
         if tags_match:
-            tags_str = tags_match.group(1)
+            tags_str = tags_match.group(1).lower()
             params["tags"] = [tag.strip() for tag in tags_str.split(',')]
-            text = re.sub(r'tags?\s+[\w,]+', '', text, flags=re.IGNORECASE)
+            text = _RE_TAGS.sub('', text)
 
         # Remaining text is the task title
         params["title"] = text.strip()
@@ -260,61 +329,31 @@ class CommandParser:
         return params
 
     @classmethod
-    def _extract_note_params(cls, text: str) -> Dict[str, Any]:
+    def _extract_note_params(cls, text: str, text_lower: str) -> Dict[str, Any]:
         """Extract note-specific parameters."""
-        text_lower = text.lower()
-
-        action = "unknown"
-        if any(word in text_lower for word in ["maak", "nieuw", "schrijf"]):
-            action = "create"
-        elif any(word in text_lower for word in ["lijst", "toon", "bekijk"]):
-            action = "list"
-        elif any(word in text_lower for word in ["zoek", "vind", "search"]):
-            action = "search"
-
-        return {"action": action}
+        return {"action": _first_match(_NOTE_ACTIONS, text_lower, "unknown")}
 
     @classmethod
-    def _extract_scan_params(cls, text: str) -> Dict[str, Any]:
+    def _extract_scan_params(cls, text: str, text_lower: str) -> Dict[str, Any]:
         """Extract scan-specific parameters."""
-        text_lower = text.lower()
-
-        scan_type = "document"
-        if "bon" in text_lower or "receipt" in text_lower:
-            scan_type = "receipt"
-        elif "foto" in text_lower or "image" in text_lower:
-            scan_type = "image"
-        elif "document" in text_lower or "pdf" in text_lower:
-            scan_type = "document"
-
-        return {"scan_type": scan_type}
+        return {"scan_type": _first_match(_SCAN_TYPES, text_lower, "document")}
 
     @classmethod
-    def _extract_help_params(cls, text: str) -> Dict[str, Any]:
+    def _extract_help_params(cls, text: str, text_lower: str) -> Dict[str, Any]:
         """Extract help-specific parameters."""
-        text_lower = text.lower()
-
+        # One dict probe per word instead of a substring search per keyword
         topic = None
-        for keyword, cmd_type in cls.COMMAND_KEYWORDS.items():
-            if keyword in text_lower:
-                topic = cmd_type
+        for token in text_lower.split():
+            topic = cls.COMMAND_KEYWORDS.get(token)
+            if topic is not None:
                 break
 
         return {"topic": topic}
 
     @classmethod
-    def _extract_time_context(cls, text: str) -> Optional[str]:
-        """Extract time context from text."""
-        if any(word in text for word in ["vandaag", "today"]):
-            return "today"
-        elif any(word in text for word in ["morgen", "tomorrow"]):
-            return "tomorrow"
-        elif any(word in text for word in ["week", "deze week"]):
-            return "this_week"
-        elif any(word in text for word in ["maand", "deze maand"]):
-            return "this_month"
-
-        return None
+    def _extract_time_context(cls, text_lower: str) -> Optional[str]:
+        """Extract time context from lowercased text."""
+        return _first_match(_TIME_CONTEXTS, text_lower, None)
 
     @classmethod
     def is_command(cls, text: str) -> bool:
@@ -327,4 +366,16 @@ class CommandParser:
         Returns:
             True if text starts with command prefix
         """
-        return text.strip().startswith(cls.COMMAND_PREFIX)
+        # Only leading whitespace matters for the prefix check
+        return text.lstrip().startswith(cls.COMMAND_PREFIX)
+
+
+# Parameter extractor per command type (unknown commands have none)
+_EXTRACTORS: Dict[CommandType, Callable[[str, str], Dict[str, Any]]] = {
+    CommandType.CALENDAR: CommandParser._extract_calendar_params,
+    CommandType.REMINDER: CommandParser._extract_calendar_params,  # Same as calendar
+    CommandType.TASK: CommandParser._extract_task_params,
+    CommandType.NOTE: CommandParser._extract_note_params,
+    CommandType.SCAN: CommandParser._extract_scan_params,
+    CommandType.HELP: CommandParser._extract_help_params,
+}
@@ -2,14 +2,36 @@
 SQLAlchemy database models.
 Part of Infrastructure layer - persistence models.
 """
+import os
+import time
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Text, ForeignKey, JSON, Integer, Sequence, Index
+from sqlalchemy import Column, String, Boolean, DateTime, Text, ForeignKey, Integer, Sequence, Index, Computed, text
 from sqlalchemy.dialects.postgresql import UUID, ARRAY, TSVECTOR, JSONB
 from sqlalchemy.orm import relationship
 import uuid
 from app.infrastructure.database.session import Base
 
 
+# Insert timestamps are filled in by PostgreSQL. Columns are naive UTC
+# (timestamp without time zone), matching datetime.utcnow() in the app.
+UTC_NOW = text("timezone('utc', now())")
+
+# Primary keys are time-ordered UUIDv7 generated by PostgreSQL
+# (uuid_generate_v7() is created in migration 023)
+UUID_V7 = text("uuid_generate_v7()")
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7 in Python, laid out like uuid_generate_v7().
+    Used as client-side default where ids must be known before the INSERT.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class UserModel(Base):
     """
     User database model (SQLAlchemy ORM).
@@ -18,15 +40,15 @@ class UserModel(Base):
 
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=UUID_V7)
     email = Column(String(255), unique=True, nullable=False, index=True)
     full_name = Column(String(255), nullable=False)
     provider = Column(String(50), nullable=False)  # google, microsoft, local
     hashed_password = Column(String(255), nullable=True)  # Only for local users
     photo_url = Column(Text, nullable=True)  # Profile photo URL (base64 data URL)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False)
 
     # Email verification
     email_verified = Column(Boolean, default=False, nullable=False)
@@ -52,9 +74,9 @@ class UserModel(Base):
     onboarding_completed = Column(Boolean, default=False, nullable=False)
 
     # Relationships
-    oauth_tokens = relationship("OAuthTokenModel", back_populates="user", cascade="all, delete-orphan")
-    settings = relationship("UserSettingsModel", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    refresh_tokens = relationship("RefreshTokenModel", back_populates="user", cascade="all, delete-orphan")
+    oauth_tokens = relationship("OAuthTokenModel", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    settings = relationship("UserSettingsModel", back_populates="user", uselist=False, cascade="all, delete-orphan", lazy="raise_on_sql")
+    refresh_tokens = relationship("RefreshTokenModel", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
 
     @property
     def inbox_email(self) -> str | None:
@@ -75,7 +97,7 @@ class OAuthTokenModel(Base):
 
     __tablename__ = "oauth_tokens"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=UUID_V7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     provider = Column(String(50), nullable=False)  # google, microsoft
     access_token = Column(Text, nullable=False)  # Encrypted in production
@@ -83,11 +105,16 @@ class OAuthTokenModel(Base):
     token_type = Column(String(50), default="Bearer", nullable=False)
     expires_at = Column(DateTime, nullable=True)
     scope = Column(Text, nullable=True)  # Space-separated scopes
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
-    user = relationship("UserModel", back_populates="oauth_tokens")
+    user = relationship("UserModel", back_populates="oauth_tokens", lazy="raise_on_sql")
+
+    __table_args__ = (
+        # One token per provider per user; target of the upsert in save_token
+        Index('ix_oauth_tokens_user_provider', 'user_id', 'provider', unique=True),
+    )
 
     def __repr__(self) -> str:
         return f"<OAuthTokenModel(user_id={self.user_id}, provider={self.provider})>"
@@ -101,16 +128,16 @@ class UserSettingsModel(Base):
 
     __tablename__ = "user_settings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=UUID_V7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False, index=True)
     primary_calendar_provider = Column(String(50), nullable=True)  # google or microsoft
     language = Column(String(10), default="nl", nullable=False)  # nl, en
     timezone = Column(String(50), default="Europe/Amsterdam", nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
-    user = relationship("UserModel", back_populates="settings")
+    user = relationship("UserModel", back_populates="settings", lazy="raise_on_sql")
 
     def __repr__(self) -> str:
         return f"<UserSettingsModel(user_id={self.user_id}, primary_provider={self.primary_calendar_provider})>"
@@ -124,17 +151,22 @@ class ConversationModel(Base):
 
     __tablename__ = "conversations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=UUID_V7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     title = Column(String(500), nullable=False)
     mode = Column(String(50), default="chat", nullable=False)  # chat, voice, note, scan
-    meta = Column(JSON, nullable=True)  # Store extra info as JSON (renamed from metadata - reserved keyword)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    meta = Column(JSONB, nullable=True)  # Store extra info as JSON (renamed from metadata - reserved keyword)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
-    user = relationship("UserModel")
-    messages = relationship("MessageModel", back_populates="conversation", cascade="all, delete-orphan", order_by="MessageModel.created_at")
+    user = relationship("UserModel", lazy="raise_on_sql")
+    messages = relationship("MessageModel", back_populates="conversation", cascade="all, delete-orphan", order_by="MessageModel.created_at", lazy="raise_on_sql")
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_conversations_user_updated', 'user_id', 'updated_at', 'id'),
+    )
 
     def __repr__(self) -> str:
         return f"<ConversationModel(id={self.id}, user_id={self.user_id}, mode={self.mode})>"
@@ -148,15 +180,28 @@ class MessageModel(Base):
 
     __tablename__ = "messages"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id"), nullable=False, index=True)
+    # Client-side default as insert sentinel for the bulk message insert,
+    # see InboxItemModel.id
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
+        server_default=UUID_V7,
+        insert_sentinel=True,
+    )
+    conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id"), nullable=False)
     role = Column(String(50), nullable=False)  # user, assistant, system
     content = Column(Text, nullable=False)
-    meta = Column(JSON, nullable=True)  # For commands, attachments, etc. (renamed from metadata - reserved keyword)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    meta = Column(JSONB, nullable=True)  # For commands, attachments, etc. (renamed from metadata - reserved keyword)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
 
     # Relationships
-    conversation = relationship("ConversationModel", back_populates="messages")
+    conversation = relationship("ConversationModel", back_populates="messages", lazy="raise_on_sql")
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_messages_conv_created', 'conversation_id', 'created_at', 'id'),
+    )
 
     def __repr__(self) -> str:
         return f"<MessageModel(id={self.id}, conversation_id={self.conversation_id}, role={self.role})>"
@@ -170,17 +215,23 @@ class PersonModel(Base):
 
     __tablename__ = "persons"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=UUID_V7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String(200), nullable=False)
     email = Column(String(255), nullable=True)
     phone_number = Column(String(50), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
-    user = relationship("UserModel")
-    tasks = relationship("TaskModel", back_populates="delegated_person", foreign_keys="TaskModel.delegated_to")
+    user = relationship("UserModel", lazy="raise_on_sql")
+    tasks = relationship("TaskModel", back_populates="delegated_person", foreign_keys="TaskModel.delegated_to", lazy="raise_on_sql")
+
+    # Indexes (trigram index serves ILIKE name lookups for @mentions)
+    __table_args__ = (
+        Index('idx_persons_user_name', 'user_id', 'name', 'id', postgresql_include=['email', 'phone_number', 'created_at', 'updated_at']),
+        Index('idx_persons_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
 
     def __repr__(self) -> str:
         return f"<PersonModel(id={self.id}, name={self.name}, user_id={self.user_id})>"
@@ -194,24 +245,40 @@ class TaskModel(Base):
 
     __tablename__ = "tasks"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    task_number = Column(Integer, Sequence('task_number_seq'), nullable=False, unique=True, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=UUID_V7)
+    task_number = Column(Integer, Sequence('task_number_seq', cache=50), nullable=False, unique=True, index=True)
+    # "Task-00000042", built by PostgreSQL on insert (see migration 012)
+    formatted_id = Column(
+        Text,
+        Computed("'Task-' || lpad(task_number::text, greatest(8, length(task_number::text)), '0')", persisted=True),
+        unique=True,
+        index=True,
+    )
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     title = Column(String(500), nullable=False)
     memo = Column(Text, nullable=True)
     delegated_to = Column(UUID(as_uuid=True), ForeignKey("persons.id"), nullable=True)
     due_date = Column(Text, nullable=True)  # Flexible text field
     priority = Column(String(20), default="medium", nullable=False)
-    status = Column(String(50), default="new", nullable=False, index=True)
+    status = Column(String(50), default="new", nullable=False)
     status_description = Column(Text, nullable=True)
     tags = Column(ARRAY(Text), nullable=True)
     completed_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
-    user = relationship("UserModel")
-    delegated_person = relationship("PersonModel", back_populates="tasks", foreign_keys=[delegated_to])
+    user = relationship("UserModel", lazy="raise_on_sql")
+    delegated_person = relationship("PersonModel", back_populates="tasks", foreign_keys=[delegated_to], lazy="raise_on_sql")
+
+    # Indexes (match the updated_at DESC, id DESC listing order)
+    __table_args__ = (
+        Index('idx_tasks_user_updated', 'user_id', 'updated_at', 'id'),
+        Index('idx_tasks_user_status_updated_id', 'user_id', 'status', 'updated_at', 'id'),
+        Index('idx_tasks_tags_gin', 'tags', postgresql_using='gin'),
+        Index('idx_tasks_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        Index('idx_tasks_memo_trgm', 'memo', postgresql_using='gin', postgresql_ops={'memo': 'gin_trgm_ops'}),
+    )
 
     def __repr__(self) -> str:
         return f"<TaskModel(id={self.id}, task_number={self.task_number}, title={self.title})>"
@@ -225,18 +292,18 @@ class NoteGroupModel(Base):
 
     __tablename__ = "note_groups"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=UUID_V7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     color = Column(String(20), default="blue", nullable=False)
     icon = Column(String(50), nullable=True)
     sort_order = Column(Integer, default=0, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
-    user = relationship("UserModel")
-    notes = relationship("NoteModel", back_populates="group", cascade="all, delete-orphan")
+    user = relationship("UserModel", lazy="raise_on_sql")
+    notes = relationship("NoteModel", back_populates="group", cascade="all, delete-orphan", lazy="raise_on_sql")
 
     def __repr__(self) -> str:
         return f"<NoteGroupModel(id={self.id}, name={self.name}, user_id={self.user_id})>"
@@ -250,7 +317,7 @@ class NoteModel(Base):
 
     __tablename__ = "notes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=UUID_V7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     group_id = Column(UUID(as_uuid=True), ForeignKey("note_groups.id", ondelete="SET NULL"), nullable=True)
     title = Column(String(500), nullable=True)
@@ -259,20 +326,31 @@ class NoteModel(Base):
     is_pinned = Column(Boolean, default=False, nullable=False)
     is_checklist = Column(Boolean, default=False, nullable=False)
     categories = Column(ARRAY(String), nullable=True, default=[])
-    search_vector = Column(TSVECTOR, nullable=True)  # For full-text search
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Full-text search vector, maintained by PostgreSQL on write (see migration 018)
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('dutch', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('dutch', coalesce(content, '')), 'B')",
+            persisted=True,
+        ),
+    )
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False)
     deleted_at = Column(DateTime, nullable=True)  # Soft delete
 
     # Relationships
-    user = relationship("UserModel")
-    group = relationship("NoteGroupModel", back_populates="notes")
-    items = relationship("NoteItemModel", back_populates="note", cascade="all, delete-orphan", order_by="NoteItemModel.sort_order")
+    user = relationship("UserModel", lazy="raise_on_sql")
+    group = relationship("NoteGroupModel", back_populates="notes", lazy="raise_on_sql")
+    items = relationship("NoteItemModel", back_populates="note", cascade="all, delete-orphan", order_by="NoteItemModel.sort_order", lazy="raise_on_sql")
 
     # Indexes
     __table_args__ = (
         Index('idx_notes_user_deleted', 'user_id', 'deleted_at'),
+        Index('idx_notes_user_pinned_updated', 'user_id', 'is_pinned', 'updated_at', 'id', postgresql_where=text('deleted_at IS NULL')),
         Index('idx_notes_search', 'search_vector', postgresql_using='gin'),
+        Index('idx_notes_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        Index('idx_notes_content_trgm', 'content', postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'}),
     )
 
     def __repr__(self) -> str:
@@ -287,19 +365,19 @@ class NoteItemModel(Base):
 
     __tablename__ = "note_items"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=UUID_V7)
     note_id = Column(UUID(as_uuid=True), ForeignKey("notes.id", ondelete="CASCADE"), nullable=False, index=True)
     content = Column(Text, nullable=False)
     is_checked = Column(Boolean, default=False, nullable=False)
     sort_order = Column(Integer, default=0, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
-    note = relationship("NoteModel", back_populates="items")
+    note = relationship("NoteModel", back_populates="items", lazy="raise_on_sql")
 
     def __repr__(self) -> str:
-        return f"<NoteItemModel(id={self.id}, note_id={self.note_id}, content={self.content[:30]})>"
+        return f"<NoteItemModel(id={self.id}, note_id={self.note_id}, sort_order={self.sort_order})>"
 
 
 class InboxItemModel(Base):
@@ -310,7 +388,16 @@ class InboxItemModel(Base):
 
     __tablename__ = "inbox_items"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Also generated client-side: inbox items are bulk-inserted, and
+    # SQLAlchemy needs the id as insert sentinel to batch INSERT ... RETURNING
+    # rows instead of falling back to one statement per row
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
+        server_default=UUID_V7,
+        insert_sentinel=True,
+    )
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     type = Column(String(50), nullable=False)  # email, calendar_event, message, etc.
     source = Column(String(100), nullable=False)  # gmail, outlook, manual, etc.
@@ -323,11 +410,11 @@ class InboxItemModel(Base):
     user_decision = Column(JSONB, nullable=True)
     linked_items = Column(JSONB, nullable=True, default=[])
     processed_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
-    user = relationship("UserModel")
+    user = relationship("UserModel", lazy="raise_on_sql")
 
     # Indexes defined in migration
 
@@ -343,15 +430,15 @@ class RefreshTokenModel(Base):
 
     __tablename__ = "refresh_tokens"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=UUID_V7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     token = Column(String(500), nullable=False, unique=True, index=True)
     expires_at = Column(DateTime, nullable=False)
     revoked = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
 
     # Relationships
-    user = relationship("UserModel", back_populates="refresh_tokens")
+    user = relationship("UserModel", back_populates="refresh_tokens", lazy="raise_on_sql")
 
     def __repr__(self) -> str:
         return f"<RefreshTokenModel(id={self.id}, user_id={self.user_id}, revoked={self.revoked})>"
@@ -10,12 +10,18 @@ from app.core.config import settings
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,  # Connections kept open in the pool
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Extra connections allowed under load
     pool_pre_ping=True,  # Verify connections before using
+    pool_use_lifo=True,  # Reuse the most recent connection so idle ones can time out
+    pool_recycle=1800,  # Replace connections before server-side idle timeouts
     echo=settings.DEBUG,  # Log SQL queries in debug mode
 )
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects keep their state after commit: INSERT ... RETURNING already brings
+# back server defaults, so repositories don't need a refresh() per write
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Base class for SQLAlchemy models
 Base = declarative_base()
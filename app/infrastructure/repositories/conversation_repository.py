@@ -2,12 +2,14 @@
 Conversation repository - data access layer.
 Part of Infrastructure layer.
 """
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, aliased, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import desc, tuple_, insert, update, select
 
-from app.infrastructure.database.models import ConversationModel, MessageModel
+from app.infrastructure.database.models import ConversationModel, MessageModel, UTC_NOW
 from app.domain.entities.conversation import Conversation, Message
 
 
@@ -45,7 +47,8 @@ class ConversationRepository:
 
         self.db.add(conversation)
         self.db.commit()
-        self.db.refresh(conversation)
+        # A new conversation has no messages; mark the collection as loaded
+        set_committed_value(conversation, "messages", [])
 
         return conversation
 
@@ -64,9 +67,13 @@ class ConversationRepository:
         Returns:
             ConversationModel or None
         """
-        query = self.db.query(ConversationModel).filter(
+        # populate_existing: pick up messages added since the conversation
+        # was first loaded in this session
+        query = self.db.query(ConversationModel).options(
+            selectinload(ConversationModel.messages)
+        ).filter(
             ConversationModel.id == conversation_id
-        )
+        ).populate_existing()
 
         if user_id:
             query = query.filter(ConversationModel.user_id == user_id)
@@ -79,6 +86,7 @@ class ConversationRepository:
         mode: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[ConversationModel]:
         """
         Get all conversations for a user.
@@ -88,12 +96,14 @@ class ConversationRepository:
             mode: Optional filter by mode
             limit: Maximum number of results
             offset: Offset for pagination
+            after: Keyset cursor (updated_at, id) of the last conversation on
+                   the previous page; only older conversations are returned
 
         Returns:
             List of ConversationModel
         """
         query = self.db.query(ConversationModel).options(
-            joinedload(ConversationModel.messages)
+            selectinload(ConversationModel.messages)
         ).filter(
             ConversationModel.user_id == user_id
         )
@@ -101,11 +111,111 @@ class ConversationRepository:
         if mode:
             query = query.filter(ConversationModel.mode == mode)
 
-        query = query.order_by(desc(ConversationModel.updated_at))
+        if after:
+            # Keyset pagination: seek past the cursor instead of scanning
+            # and discarding OFFSET rows
+            query = query.filter(
+                tuple_(ConversationModel.updated_at, ConversationModel.id) < tuple_(*after)
+            )
+
+        query = query.order_by(desc(ConversationModel.updated_at), desc(ConversationModel.id))
         query = query.limit(limit).offset(offset)
 
         return query.all()
 
+    def get_user_conversation_entities(
+        self,
+        user_id: UUID,
+        mode: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Conversation]:
+        """
+        Get all conversations for a user as domain entities.
+
+        Same filters and ordering as get_user_conversations, but reads plain
+        Core rows and builds the entities directly, skipping ORM identity
+        map and instance state for the list endpoint.
+
+        Args:
+            user_id: User ID
+            mode: Optional filter by mode
+            limit: Maximum number of results
+            offset: Offset for pagination
+            after: Keyset cursor (updated_at, id) of the last conversation on
+                   the previous page
+
+        Returns:
+            List of Conversation entities with their messages
+        """
+        stmt = select(
+            ConversationModel.id,
+            ConversationModel.user_id,
+            ConversationModel.title,
+            ConversationModel.mode,
+            ConversationModel.created_at,
+            ConversationModel.updated_at,
+            ConversationModel.meta,
+        ).where(ConversationModel.user_id == user_id)
+
+        if mode:
+            stmt = stmt.where(ConversationModel.mode == mode)
+
+        if after:
+            stmt = stmt.where(
+                tuple_(ConversationModel.updated_at, ConversationModel.id) < tuple_(*after)
+            )
+
+        stmt = stmt.order_by(
+            desc(ConversationModel.updated_at), desc(ConversationModel.id)
+        ).limit(limit).offset(offset)
+
+        conversations = {
+            row.id: Conversation(
+                id=row.id,
+                user_id=row.user_id,
+                title=row.title,
+                mode=row.mode,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                messages=[],
+                metadata=row.meta or {},
+            )
+            for row in self.db.execute(stmt)
+        }
+
+        if not conversations:
+            return []
+
+        # Messages for the whole page in one IN query
+        message_rows = self.db.execute(
+            select(
+                MessageModel.id,
+                MessageModel.conversation_id,
+                MessageModel.role,
+                MessageModel.content,
+                MessageModel.created_at,
+                MessageModel.meta,
+            )
+            .where(MessageModel.conversation_id.in_(list(conversations)))
+            .order_by(MessageModel.created_at, MessageModel.id)
+        )
+
+        for row in message_rows:
+            conversations[row.conversation_id].messages.append(
+                Message(
+                    id=row.id,
+                    conversation_id=row.conversation_id,
+                    role=row.role,
+                    content=row.content,
+                    created_at=row.created_at,
+                    metadata=row.meta or {},
+                )
+            )
+
+        return list(conversations.values())
+
     def update_conversation(
         self,
         conversation_id: UUID,
@@ -123,21 +233,29 @@ class ConversationRepository:
         Returns:
             Updated ConversationModel or None
         """
-        conversation = self.db.query(ConversationModel).filter(
-            ConversationModel.id == conversation_id
-        ).first()
-
-        if not conversation:
-            return None
+        values = {}
 
         if title is not None:
-            conversation.title = title
+            values["title"] = title
 
         if metadata is not None:
-            conversation.meta = metadata
-
+            values["meta"] = metadata
+
+        if not values:
+            return self.db.get(ConversationModel, conversation_id)
+
+        # Set updated_at explicitly: the row is usually already loaded, and
+        # RETURNING only refreshes the columns named in values()
+        values["updated_at"] = datetime.utcnow()
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE
+        conversation = self.db.scalars(
+            update(ConversationModel)
+            .where(ConversationModel.id == conversation_id)
+            .values(**values)
+            .returning(ConversationModel)
+        ).one_or_none()
         self.db.commit()
-        self.db.refresh(conversation)
 
         return conversation
 
@@ -151,9 +269,7 @@ class ConversationRepository:
         Returns:
             True if deleted, False if not found
         """
-        conversation = self.db.query(ConversationModel).filter(
-            ConversationModel.id == conversation_id
-        ).first()
+        conversation = self.db.get(ConversationModel, conversation_id)
 
         if not conversation:
             return False
@@ -191,25 +307,68 @@ class ConversationRepository:
 
         self.db.add(message)
 
-        # Update conversation updated_at timestamp
-        conversation = self.db.query(ConversationModel).filter(
-            ConversationModel.id == conversation_id
-        ).first()
+        # Bump the conversation's updated_at server-side; no SELECT needed
+        self.db.execute(
+            update(ConversationModel)
+            .where(ConversationModel.id == conversation_id)
+            .values(updated_at=UTC_NOW)
+        )
+        self.db.commit()
 
-        if conversation:
-            from datetime import datetime
-            conversation.updated_at = datetime.utcnow()
+        return message
 
+    def add_messages_bulk(
+        self,
+        conversation_id: UUID,
+        messages: List[dict],
+    ) -> List[MessageModel]:
+        """
+        Add several messages to a conversation in one round-trip.
+
+        Args:
+            conversation_id: Conversation ID
+            messages: Dicts with role, content and optional metadata, in
+                      conversation order
+
+        Returns:
+            Created MessageModels in the given order
+        """
+        now = datetime.utcnow()
+        # created_at is set explicitly: the server default (now()) is the same
+        # for every row in a transaction and would lose the message order
+        rows = [
+            {
+                "conversation_id": conversation_id,
+                "role": message["role"],
+                "content": message["content"],
+                "meta": message.get("metadata") or {},
+                "created_at": now + timedelta(microseconds=index),
+            }
+            for index, message in enumerate(messages)
+        ]
+
+        # One multi-row INSERT ... RETURNING instead of an INSERT per message;
+        # batching relies on the client-side id default (insert sentinel)
+        created = self.db.scalars(
+            insert(MessageModel).returning(MessageModel, sort_by_parameter_order=True),
+            rows,
+        ).all()
+
+        self.db.execute(
+            update(ConversationModel)
+            .where(ConversationModel.id == conversation_id)
+            .values(updated_at=now)
+        )
         self.db.commit()
-        self.db.refresh(message)
 
-        return message
+        return created
 
     def get_messages(
         self,
         conversation_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[MessageModel]:
         """
         Get messages for a conversation.
@@ -218,13 +377,22 @@ class ConversationRepository:
             conversation_id: Conversation ID
             limit: Maximum number of messages
             offset: Offset for pagination
+            after: Keyset cursor (created_at, id) of the last message on the
+                   previous page; only newer messages are returned
 
         Returns:
             List of MessageModel ordered by created_at
         """
-        messages = self.db.query(MessageModel).filter(
+        query = self.db.query(MessageModel).filter(
             MessageModel.conversation_id == conversation_id
-        ).order_by(MessageModel.created_at).limit(limit).offset(offset).all()
+        )
+
+        if after:
+            query = query.filter(tuple_(MessageModel.created_at, MessageModel.id) > tuple_(*after))
+
+        messages = query.order_by(
+            MessageModel.created_at, MessageModel.id
+        ).limit(limit).offset(offset).all()
 
         return messages
 
@@ -243,12 +411,18 @@ class ConversationRepository:
         Returns:
             List of MessageModel (ordered oldest to newest)
         """
-        messages = self.db.query(MessageModel).filter(
+        # Take the newest rows in a subquery and let the outer query return
+        # them oldest first, so no reversal is needed in Python
+        latest = self.db.query(MessageModel).filter(
             MessageModel.conversation_id == conversation_id
-        ).order_by(desc(MessageModel.created_at)).limit(limit).all()
+        ).order_by(
+            desc(MessageModel.created_at), desc(MessageModel.id)
+        ).limit(limit).subquery()
+        latest_message = aliased(MessageModel, latest)
 
-        # Reverse to get chronological order (oldest first)
-        return list(reversed(messages))
+        return self.db.query(latest_message).order_by(
+            latest.c.created_at, latest.c.id
+        ).all()
 
     def conversation_to_entity(self, model: ConversationModel) -> Conversation:
         """
@@ -262,7 +436,7 @@ class ConversationRepository:
         """
         messages = [
             Message(
-                id=str(msg.id),
+                id=msg.id,
                 conversation_id=msg.conversation_id,
                 role=msg.role,
                 content=msg.content,
@@ -6,7 +6,7 @@ from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, insert
 
 from app.infrastructure.database.models import InboxItemModel
 from app.domain.entities.inbox_item import InboxItem, InboxItemType, InboxStatus, Priority
@@ -53,6 +53,42 @@ class InboxRepository:
         self.db.refresh(item)
         return item
 
+    def bulk_create_inbox_items(self, items: List[InboxItem]) -> List[InboxItemModel]:
+        """
+        Create many inbox items in a single round trip.
+        Uses one executemany INSERT ... RETURNING instead of a commit per item.
+        """
+        if not items:
+            return []
+
+        rows = [
+            {
+                "user_id": item.user_id,
+                "type": item.type.value,
+                "source": item.source,
+                "status": item.status.value,
+                "priority": item.priority.value,
+                "subject": item.subject,
+                "content": item.content,
+                "raw_data": item.raw_data or {},
+                "ai_suggestion": item.ai_suggestion,
+                "user_decision": item.user_decision,
+                "linked_items": item.linked_items or [],
+                "processed_at": item.processed_at,
+                "created_at": item.created_at,
+                "updated_at": item.updated_at,
+            }
+            for item in items
+        ]
+        models = list(
+            self.db.scalars(
+                insert(InboxItemModel).returning(InboxItemModel, sort_by_parameter_order=True),
+                rows,
+            )
+        )
+        self.db.commit()
+        return models
+
     def get_inbox_item(self, item_id: UUID, user_id: UUID) -> Optional[InboxItemModel]:
         """Get a single inbox item by ID."""
         return (
@@ -2,11 +2,13 @@
 Note repository - data access layer.
 Part of Infrastructure layer.
 """
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy import desc, or_, and_
+from sqlalchemy import desc, or_, and_, tuple_, update, delete
 
 from app.infrastructure.database.models import NoteModel, NoteGroupModel, NoteItemModel
 from app.domain.entities.note import Note, NoteItem
@@ -40,7 +42,6 @@ class NoteRepository:
 
         self.db.add(group)
         self.db.commit()
-        self.db.refresh(group)
 
         return group
 
@@ -50,12 +51,13 @@ class NoteRepository:
         user_id: Optional[UUID] = None,
     ) -> Optional[NoteGroupModel]:
         """Get a note group by ID."""
-        query = self.db.query(NoteGroupModel).filter(NoteGroupModel.id == group_id)
+        # Session.get checks the identity map before going to the database
+        group = self.db.get(NoteGroupModel, group_id)
 
-        if user_id:
-            query = query.filter(NoteGroupModel.user_id == user_id)
+        if group and user_id and group.user_id != user_id:
+            return None
 
-        return query.first()
+        return group
 
     def get_user_note_groups(
         self,
@@ -80,16 +82,25 @@ class NoteRepository:
         **updates
     ) -> Optional[NoteGroupModel]:
         """Update a note group."""
-        group = self.get_note_group(group_id, user_id)
-        if not group:
-            return None
-
-        for key, value in updates.items():
-            if value is not None and hasattr(group, key):
-                setattr(group, key, value)
-
+        values = {
+            key: value for key, value in updates.items()
+            if value is not None and hasattr(NoteGroupModel, key)
+        }
+        if not values:
+            return self.get_note_group(group_id, user_id)
+
+        # Set updated_at explicitly: the row is usually already loaded, and
+        # RETURNING only refreshes the columns named in values()
+        values["updated_at"] = datetime.utcnow()
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE
+        group = self.db.scalars(
+            update(NoteGroupModel)
+            .where(NoteGroupModel.id == group_id, NoteGroupModel.user_id == user_id)
+            .values(**values)
+            .returning(NoteGroupModel)
+        ).one_or_none()
         self.db.commit()
-        self.db.refresh(group)
 
         return group
 
@@ -120,8 +131,9 @@ class NoteRepository:
         is_checklist: bool = False,
         group_id: Optional[UUID] = None,
         categories: Optional[List[str]] = None,
+        commit: bool = True,
     ) -> NoteModel:
-        """Create a new note."""
+        """Create a new note. With commit=False the note is only flushed."""
         note = NoteModel(
             user_id=user_id,
             group_id=group_id,
@@ -134,8 +146,12 @@ class NoteRepository:
         )
 
         self.db.add(note)
-        self.db.commit()
-        self.db.refresh(note)
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        # A new note has no items; mark the collection as loaded
+        set_committed_value(note, "items", [])
 
         return note
 
@@ -146,10 +162,12 @@ class NoteRepository:
         include_deleted: bool = False,
     ) -> Optional[NoteModel]:
         """Get a note by ID."""
+        # populate_existing: pick up items added since the note was first
+        # loaded in this session
         query = self.db.query(NoteModel).options(
             joinedload(NoteModel.group),
-            joinedload(NoteModel.items)
-        ).filter(NoteModel.id == note_id)
+            selectinload(NoteModel.items)
+        ).filter(NoteModel.id == note_id).populate_existing()
 
         if user_id:
             query = query.filter(NoteModel.user_id == user_id)
@@ -167,11 +185,17 @@ class NoteRepository:
         search: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[Tuple[bool, datetime, UUID]] = None,
     ) -> List[NoteModel]:
-        """Get notes for a user with optional filters."""
+        """
+        Get notes for a user with optional filters.
+
+        after is a keyset cursor (is_pinned, updated_at, id) of the last note
+        on the previous page; only notes sorting after it are returned.
+        """
         query = self.db.query(NoteModel).options(
             joinedload(NoteModel.group),
-            joinedload(NoteModel.items)
+            selectinload(NoteModel.items)
         ).filter(NoteModel.user_id == user_id)
 
         if not include_deleted:
@@ -189,10 +213,16 @@ class NoteRepository:
                 )
             )
 
+        if after:
+            query = query.filter(
+                tuple_(NoteModel.is_pinned, NoteModel.updated_at, NoteModel.id) < tuple_(*after)
+            )
+
         # Order: pinned first, then by updated_at desc
         query = query.order_by(
             desc(NoteModel.is_pinned),
-            desc(NoteModel.updated_at)
+            desc(NoteModel.updated_at),
+            desc(NoteModel.id)
         )
 
         return query.limit(limit).offset(offset).all()
@@ -217,16 +247,24 @@ class NoteRepository:
         **updates
     ) -> Optional[NoteModel]:
         """Update a note."""
-        note = self.get_note(note_id, user_id)
-        if not note:
-            return None
-
-        for key, value in updates.items():
-            if hasattr(note, key):
-                setattr(note, key, value)
-
+        values = {key: value for key, value in updates.items() if hasattr(NoteModel, key)}
+        if not values:
+            return self.get_note(note_id, user_id)
+        values["updated_at"] = datetime.utcnow()
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE
+        note = self.db.scalars(
+            update(NoteModel)
+            .where(
+                NoteModel.id == note_id,
+                NoteModel.user_id == user_id,
+                NoteModel.deleted_at.is_(None),
+            )
+            .values(**values)
+            .returning(NoteModel)
+            .options(selectinload(NoteModel.items))
+        ).one_or_none()
         self.db.commit()
-        self.db.refresh(note)
 
         return note
 
@@ -236,16 +274,18 @@ class NoteRepository:
         user_id: UUID,
     ) -> bool:
         """Soft delete a note."""
-        from datetime import datetime
-
-        note = self.get_note(note_id, user_id)
-        if not note:
-            return False
-
-        note.deleted_at = datetime.utcnow()
+        result = self.db.execute(
+            update(NoteModel)
+            .where(
+                NoteModel.id == note_id,
+                NoteModel.user_id == user_id,
+                NoteModel.deleted_at.is_(None),
+            )
+            .values(deleted_at=datetime.utcnow())
+        )
         self.db.commit()
 
-        return True
+        return result.rowcount > 0
 
     def hard_delete_note(
         self,
@@ -253,14 +293,13 @@ class NoteRepository:
         user_id: UUID,
     ) -> bool:
         """Permanently delete a note."""
-        note = self.get_note(note_id, user_id, include_deleted=True)
-        if not note:
-            return False
-
-        self.db.delete(note)
+        # note_items go with it through ON DELETE CASCADE
+        result = self.db.execute(
+            delete(NoteModel).where(NoteModel.id == note_id, NoteModel.user_id == user_id)
+        )
         self.db.commit()
 
-        return True
+        return result.rowcount > 0
 
     def restore_note(
         self,
@@ -268,13 +307,18 @@ class NoteRepository:
         user_id: UUID,
     ) -> Optional[NoteModel]:
         """Restore a soft-deleted note."""
-        note = self.get_note(note_id, user_id, include_deleted=True)
-        if not note or not note.deleted_at:
-            return None
-
-        note.deleted_at = None
+        note = self.db.scalars(
+            update(NoteModel)
+            .where(
+                NoteModel.id == note_id,
+                NoteModel.user_id == user_id,
+                NoteModel.deleted_at.is_not(None),
+            )
+            .values(deleted_at=None, updated_at=datetime.utcnow())
+            .returning(NoteModel)
+            .options(selectinload(NoteModel.items))
+        ).one_or_none()
         self.db.commit()
-        self.db.refresh(note)
 
         return note
 
@@ -286,10 +330,11 @@ class NoteRepository:
         content: str,
         is_checked: bool = False,
         sort_order: int = 0,
+        commit: bool = True,
     ) -> Optional[NoteItemModel]:
-        """Create a note item (checklist item)."""
+        """Create a note item (checklist item). With commit=False the item is only flushed."""
         # Verify note exists and is a checklist
-        note = self.db.query(NoteModel).filter(NoteModel.id == note_id).first()
+        note = self.db.get(NoteModel, note_id)
         if not note or not note.is_checklist:
             return None
 
@@ -301,8 +346,10 @@ class NoteRepository:
         )
 
         self.db.add(item)
-        self.db.commit()
-        self.db.refresh(item)
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
 
         return item
 
@@ -330,16 +377,22 @@ class NoteRepository:
         **updates
     ) -> Optional[NoteItemModel]:
         """Update a note item."""
-        item = self.get_note_item(item_id, note_id)
-        if not item:
-            return None
-
-        for key, value in updates.items():
-            if value is not None and hasattr(item, key):
-                setattr(item, key, value)
-
+        values = {
+            key: value for key, value in updates.items()
+            if value is not None and hasattr(NoteItemModel, key)
+        }
+        if not values:
+            return self.get_note_item(item_id, note_id)
+        values["updated_at"] = datetime.utcnow()
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE
+        item = self.db.scalars(
+            update(NoteItemModel)
+            .where(NoteItemModel.id == item_id, NoteItemModel.note_id == note_id)
+            .values(**values)
+            .returning(NoteItemModel)
+        ).one_or_none()
         self.db.commit()
-        self.db.refresh(item)
 
         return item
 
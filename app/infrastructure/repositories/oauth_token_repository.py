@@ -5,7 +5,9 @@ Part of Infrastructure layer.
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
+from sqlalchemy import delete, lambda_stmt, select
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.infrastructure.database.models import OAuthTokenModel
 
 
@@ -41,31 +43,27 @@ class OAuthTokenRepository:
         Returns:
             Saved OAuthTokenModel
         """
-        # Check if token already exists
-        existing = self.get_token(user_id, provider)
-
-        if existing:
-            # Update existing token
-            existing.access_token = access_token
-            existing.refresh_token = refresh_token
-            existing.expires_at = expires_at
-            existing.scope = scope
-            existing.updated_at = datetime.utcnow()
-            token = existing
-        else:
-            # Create new token
-            token = OAuthTokenModel(
-                user_id=user_id,
-                provider=provider,
-                access_token=access_token,
-                refresh_token=refresh_token,
-                expires_at=expires_at,
-                scope=scope,
+        # Single atomic upsert on the (user_id, provider) unique index; avoids
+        # the SELECT round-trip and the race between concurrent first saves
+        values = {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "expires_at": expires_at,
+            "scope": scope,
+        }
+        stmt = (
+            pg_insert(OAuthTokenModel)
+            .values(user_id=user_id, provider=provider, **values)
+            .on_conflict_do_update(
+                index_elements=[OAuthTokenModel.user_id, OAuthTokenModel.provider],
+                set_={**values, "updated_at": datetime.utcnow()},
             )
-            self.db.add(token)
+            .returning(OAuthTokenModel)
+            .execution_options(populate_existing=True)
+        )
 
+        token = self.db.scalars(stmt).one()
         self.db.commit()
-        self.db.refresh(token)
         return token
 
     def get_token(self, user_id: UUID, provider: str) -> Optional[OAuthTokenModel]:
@@ -79,14 +77,15 @@ class OAuthTokenRepository:
         Returns:
             OAuthTokenModel if found, None otherwise
         """
-        return (
-            self.db.query(OAuthTokenModel)
-            .filter(
+        # Read on every calendar call; lambda_stmt caches the statement
+        # construction as well as the compiled SQL
+        stmt = lambda_stmt(
+            lambda: select(OAuthTokenModel).where(
                 OAuthTokenModel.user_id == user_id,
                 OAuthTokenModel.provider == provider,
             )
-            .first()
         )
+        return self.db.scalars(stmt).first()
 
     def delete_token(self, user_id: UUID, provider: str) -> bool:
         """
@@ -99,13 +98,15 @@ class OAuthTokenRepository:
         Returns:
             True if deleted, False if not found
         """
-        token = self.get_token(user_id, provider)
-        if not token:
-            return False
-
-        self.db.delete(token)
+        # One DELETE instead of get_token() followed by a DELETE
+        result = self.db.execute(
+            delete(OAuthTokenModel).where(
+                OAuthTokenModel.user_id == user_id,
+                OAuthTokenModel.provider == provider,
+            )
+        )
         self.db.commit()
-        return True
+        return result.rowcount > 0
 
     def get_all_tokens(self, user_id: UUID) -> list[OAuthTokenModel]:
         """
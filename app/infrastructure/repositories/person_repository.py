@@ -2,9 +2,11 @@
 Person repository - data access layer.
 Part of Infrastructure layer.
 """
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
+from sqlalchemy import tuple_, update, lambda_stmt, select
 
 from app.infrastructure.database.models import PersonModel
 from app.domain.entities.person import Person
@@ -44,7 +46,6 @@ class PersonRepository:
 
         self.db.add(person)
         self.db.commit()
-        self.db.refresh(person)
 
         return person
 
@@ -63,18 +64,20 @@ class PersonRepository:
         Returns:
             PersonModel or None
         """
-        query = self.db.query(PersonModel).filter(PersonModel.id == person_id)
+        # Session.get checks the identity map before going to the database
+        person = self.db.get(PersonModel, person_id)
 
-        if user_id:
-            query = query.filter(PersonModel.user_id == user_id)
+        if person and user_id and person.user_id != user_id:
+            return None
 
-        return query.first()
+        return person
 
     def get_user_persons(
         self,
         user_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[Tuple[str, UUID]] = None,
     ) -> List[PersonModel]:
         """
         Get all persons for a user.
@@ -83,14 +86,20 @@ class PersonRepository:
             user_id: User ID
             limit: Maximum number of results
             offset: Offset for pagination
+            after: Keyset cursor (name, id) of the last person on the
+                   previous page
 
         Returns:
             List of PersonModel
         """
+        query = self.db.query(PersonModel).filter(PersonModel.user_id == user_id)
+
+        if after:
+            query = query.filter(tuple_(PersonModel.name, PersonModel.id) > tuple_(*after))
+
         persons = (
-            self.db.query(PersonModel)
-            .filter(PersonModel.user_id == user_id)
-            .order_by(PersonModel.name)
+            query
+            .order_by(PersonModel.name, PersonModel.id)
             .limit(limit)
             .offset(offset)
             .all()
@@ -113,12 +122,13 @@ class PersonRepository:
         Returns:
             PersonModel or None
         """
-        return (
-            self.db.query(PersonModel)
-            .filter(PersonModel.user_id == user_id)
-            .filter(PersonModel.name.ilike(name))
-            .first()
+        stmt = lambda_stmt(
+            lambda: select(PersonModel)
+            .where(PersonModel.user_id == user_id)
+            .where(PersonModel.name.ilike(name))
+            .limit(1)
         )
+        return self.db.scalars(stmt).first()
 
     def update_person(
         self,
@@ -139,22 +149,32 @@ class PersonRepository:
         Returns:
             Updated PersonModel or None
         """
-        person = self.db.query(PersonModel).filter(PersonModel.id == person_id).first()
-
-        if not person:
-            return None
+        values = {}
 
         if name is not None:
-            person.name = name
+            values["name"] = name
 
         if email is not None:
-            person.email = email
+            values["email"] = email
 
         if phone_number is not None:
-            person.phone_number = phone_number
-
+            values["phone_number"] = phone_number
+
+        if not values:
+            return self.db.get(PersonModel, person_id)
+
+        # Set updated_at explicitly: the row is usually already loaded, and
+        # RETURNING only refreshes the columns named in values()
+        values["updated_at"] = datetime.utcnow()
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE
+        person = self.db.scalars(
+            update(PersonModel)
+            .where(PersonModel.id == person_id)
+            .values(**values)
+            .returning(PersonModel)
+        ).one_or_none()
         self.db.commit()
-        self.db.refresh(person)
 
         return person
 
@@ -168,7 +188,7 @@ class PersonRepository:
         Returns:
             True if deleted, False if not found
         """
-        person = self.db.query(PersonModel).filter(PersonModel.id == person_id).first()
+        person = self.db.get(PersonModel, person_id)
 
         if not person:
             return False
@@ -2,15 +2,22 @@
 Task repository - data access layer.
 Part of Infrastructure layer.
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
+from datetime import datetime
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, or_
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import desc, or_, tuple_, select, update
 
-from app.infrastructure.database.models import TaskModel
+from app.infrastructure.database.models import TaskModel, PersonModel
 from app.domain.entities.task import Task
 
 
+# List views only show the delegated person's name, so don't fetch the
+# rest of the persons row for every task.
+_DELEGATED_PERSON_NAME_ONLY = joinedload(TaskModel.delegated_person).load_only(PersonModel.name)
+
+
 class TaskRepository:
     """Repository for task persistence operations."""
 
@@ -28,6 +35,7 @@ class TaskRepository:
         status: str = "new",
         status_description: Optional[str] = None,
         tags: Optional[List[str]] = None,
+        commit: bool = True,
     ) -> TaskModel:
         """
         Create a new task.
@@ -42,6 +50,8 @@ class TaskRepository:
             status: Status
             status_description: Status description with annotations
             tags: List of tags
+            commit: Commit right away; pass False to only flush and let the
+                    caller commit together with its other writes
 
         Returns:
             Created TaskModel
@@ -59,11 +69,78 @@ class TaskRepository:
         )
 
         self.db.add(task)
-        self.db.commit()
-        self.db.refresh(task)
+        # INSERT ... RETURNING already brings back task_number, formatted_id
+        # and the timestamps, so no refresh() is needed
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+
+        # delegated_person is raise_on_sql; set it so callers can read it
+        person = self.db.get(PersonModel, delegated_to) if delegated_to else None
+        set_committed_value(task, "delegated_person", person)
 
         return task
 
+    def create_task_with_delegation(
+        self,
+        user_id: UUID,
+        title: str,
+        delegated_to_name: str,
+        memo: Optional[str] = None,
+        due_date: Optional[str] = None,
+        priority: str = "medium",
+        status: str = "new",
+        status_description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> TaskModel:
+        """
+        Create a new task delegated to a person looked up by name.
+
+        The person lookup is embedded in the INSERT as a scalar subquery, so
+        lookup and insert take one round trip. If no person matches, the task
+        is created without delegation.
+
+        Args:
+            user_id: User ID
+            title: Task title
+            delegated_to_name: Person name to delegate to (case-insensitive)
+            memo: Task memo
+            due_date: Due date (flexible text)
+            priority: Priority (low, medium, high)
+            status: Status
+            status_description: Status description with annotations
+            tags: List of tags
+
+        Returns:
+            Created TaskModel
+        """
+        person_id = (
+            select(PersonModel.id)
+            .where(PersonModel.user_id == user_id)
+            .where(PersonModel.name.ilike(delegated_to_name))
+            .limit(1)
+            .scalar_subquery()
+        )
+
+        task = TaskModel(
+            user_id=user_id,
+            title=title,
+            memo=memo,
+            delegated_to=person_id,
+            due_date=due_date,
+            priority=priority,
+            status=status,
+            status_description=status_description,
+            tags=tags or [],
+        )
+
+        self.db.add(task)
+        self.db.commit()
+
+        # Reload with the delegated person the subquery resolved to
+        return self.get_task(task.id)
+
     def get_task(
         self,
         task_id: UUID,
@@ -111,6 +188,29 @@ class TaskRepository:
             .first()
         )
 
+    def get_task_by_formatted_id(
+        self,
+        formatted_id: str,
+        user_id: UUID,
+    ) -> Optional[TaskModel]:
+        """
+        Get a task by its formatted ID (e.g. "Task-00000042").
+
+        Args:
+            formatted_id: Formatted task ID
+            user_id: User ID
+
+        Returns:
+            TaskModel or None
+        """
+        return (
+            self.db.query(TaskModel)
+            .options(joinedload(TaskModel.delegated_person))
+            .filter(TaskModel.formatted_id == formatted_id)
+            .filter(TaskModel.user_id == user_id)
+            .first()
+        )
+
     def get_user_tasks(
         self,
         user_id: UUID,
@@ -120,6 +220,7 @@ class TaskRepository:
         tag: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[TaskModel]:
         """
         Get tasks for a user with optional filters.
@@ -132,12 +233,14 @@ class TaskRepository:
             tag: Filter by tag
             limit: Maximum number of results
             offset: Offset for pagination
+            after: Keyset cursor (updated_at, id) of the last task on the
+                   previous page; only older tasks are returned
 
         Returns:
             List of TaskModel
         """
         query = self.db.query(TaskModel).options(
-            joinedload(TaskModel.delegated_person)
+            _DELEGATED_PERSON_NAME_ONLY
         ).filter(TaskModel.user_id == user_id)
 
         if status:
@@ -153,7 +256,12 @@ class TaskRepository:
             # Check if tag exists in tags array
             query = query.filter(TaskModel.tags.contains([tag]))
 
-        query = query.order_by(desc(TaskModel.updated_at))
+        if after:
+            # Keyset pagination: seek past the cursor instead of scanning
+            # and discarding OFFSET rows
+            query = query.filter(tuple_(TaskModel.updated_at, TaskModel.id) < tuple_(*after))
+
+        query = query.order_by(desc(TaskModel.updated_at), desc(TaskModel.id))
         query = query.limit(limit).offset(offset)
 
         return query.all()
@@ -179,7 +287,7 @@ class TaskRepository:
 
         tasks = (
             self.db.query(TaskModel)
-            .options(joinedload(TaskModel.delegated_person))
+            .options(_DELEGATED_PERSON_NAME_ONLY)
             .filter(TaskModel.user_id == user_id)
             .filter(
                 or_(
@@ -225,43 +333,57 @@ class TaskRepository:
         Returns:
             Updated TaskModel or None
         """
-        task = self.db.query(TaskModel).filter(TaskModel.id == task_id).first()
-
-        if not task:
-            return None
+        values = {}
 
         if title is not None:
-            task.title = title
+            values["title"] = title
 
         if memo is not None:
-            task.memo = memo
+            values["memo"] = memo
 
         if delegated_to is not None:
-            task.delegated_to = delegated_to
+            values["delegated_to"] = delegated_to
 
         if due_date is not None:
-            task.due_date = due_date
+            values["due_date"] = due_date
 
         if priority is not None:
-            task.priority = priority
+            values["priority"] = priority
 
         if status is not None:
-            task.status = status
+            values["status"] = status
 
         if status_description is not None:
-            task.status_description = status_description
+            values["status_description"] = status_description
 
         if tags is not None:
-            task.tags = tags
+            values["tags"] = tags
 
         if completed_at is not None:
-            if completed_at is False:
-                task.completed_at = None
-            else:
-                task.completed_at = completed_at
-
+            values["completed_at"] = None if completed_at is False else completed_at
+
+        if not values:
+            return self.get_task(task_id)
+
+        # Set updated_at explicitly: the row is usually already loaded, and
+        # RETURNING only refreshes the columns named in values(); a stale value
+        # would also break the updated_at keyset cursor
+        values["updated_at"] = datetime.utcnow()
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh
+        task = self.db.scalars(
+            update(TaskModel)
+            .where(TaskModel.id == task_id)
+            .values(**values)
+            .returning(TaskModel)
+        ).one_or_none()
         self.db.commit()
-        self.db.refresh(task)
+
+        if task:
+            # Point delegated_person at the current delegate; Session.get is
+            # an identity-map hit when the caller already loaded the task
+            person = self.db.get(PersonModel, task.delegated_to) if task.delegated_to else None
+            set_committed_value(task, "delegated_person", person)
 
         return task
 
@@ -275,7 +397,7 @@ class TaskRepository:
         Returns:
             True if deleted, False if not found
         """
-        task = self.db.query(TaskModel).filter(TaskModel.id == task_id).first()
+        task = self.db.get(TaskModel, task_id)
 
         if not task:
             return False
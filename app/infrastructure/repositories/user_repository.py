@@ -4,6 +4,7 @@ Part of Infrastructure layer.
 """
 from typing import Optional
 from uuid import UUID
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.domain.entities.user import User
@@ -63,7 +64,7 @@ class UserRepository:
         Returns:
             User domain entity if found, None otherwise
         """
-        db_user = self.db.query(UserModel).filter(UserModel.id == user_id).first()
+        db_user = self.db.get(UserModel, user_id)
         return self._to_domain(db_user) if db_user else None
 
     def get_by_email(self, email: str) -> Optional[User]:
@@ -76,11 +77,9 @@ class UserRepository:
         Returns:
             User domain entity if found, None otherwise
         """
-        db_user = (
-            self.db.query(UserModel)
-            .filter(UserModel.email == email.lower().strip())
-            .first()
-        )
+        email = email.lower().strip()
+        stmt = lambda_stmt(lambda: select(UserModel).where(UserModel.email == email))
+        db_user = self.db.scalars(stmt).first()
         return self._to_domain(db_user) if db_user else None
 
     def update(self, user: User) -> User:
@@ -93,7 +92,7 @@ class UserRepository:
         Returns:
             Updated user domain entity
         """
-        db_user = self.db.query(UserModel).filter(UserModel.id == user.id).first()
+        db_user = self.db.get(UserModel, user.id)
         if not db_user:
             raise ValueError(f"User with ID {user.id} not found")
 
@@ -117,7 +116,7 @@ class UserRepository:
         Returns:
             True if deleted, False if not found
         """
-        db_user = self.db.query(UserModel).filter(UserModel.id == user_id).first()
+        db_user = self.db.get(UserModel, user_id)
         if not db_user:
             return False
 
@@ -135,12 +134,9 @@ class UserRepository:
         Returns:
             True if user exists, False otherwise
         """
-        return (
-            self.db.query(UserModel)
-            .filter(UserModel.email == email.lower().strip())
-            .first()
-            is not None
-        )
+        email = email.lower().strip()
+        stmt = lambda_stmt(lambda: select(UserModel.id).where(UserModel.email == email).limit(1))
+        return self.db.scalars(stmt).first() is not None
 
     @staticmethod
     def _to_domain(db_user: UserModel) -> User:
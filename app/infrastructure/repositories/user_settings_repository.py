@@ -4,9 +4,9 @@ Part of Infrastructure layer.
 """
 from typing import Optional
 from uuid import UUID
-from datetime import datetime
 from sqlalchemy.orm import Session
-from app.infrastructure.database.models import UserSettingsModel
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.infrastructure.database.models import UserSettingsModel, UTC_NOW
 
 
 class UserSettingsRepository:
@@ -84,13 +84,7 @@ class UserSettingsRepository:
         Returns:
             Updated UserSettingsModel
         """
-        settings = self.get_or_create_settings(user_id)
-        settings.primary_calendar_provider = provider
-        settings.updated_at = datetime.utcnow()
-
-        self.db.commit()
-        self.db.refresh(settings)
-        return settings
+        return self._upsert(user_id, primary_calendar_provider=provider)
 
     def update_language(self, user_id: UUID, language: str) -> UserSettingsModel:
         """
@@ -103,13 +97,7 @@ class UserSettingsRepository:
         Returns:
             Updated UserSettingsModel
         """
-        settings = self.get_or_create_settings(user_id)
-        settings.language = language
-        settings.updated_at = datetime.utcnow()
-
-        self.db.commit()
-        self.db.refresh(settings)
-        return settings
+        return self._upsert(user_id, language=language)
 
     def update_timezone(self, user_id: UUID, timezone: str) -> UserSettingsModel:
         """
@@ -122,10 +110,33 @@ class UserSettingsRepository:
         Returns:
             Updated UserSettingsModel
         """
-        settings = self.get_or_create_settings(user_id)
-        settings.timezone = timezone
-        settings.updated_at = datetime.utcnow()
+        return self._upsert(user_id, timezone=timezone)
+
+    def _upsert(self, user_id: UUID, **values) -> UserSettingsModel:
+        """
+        Set settings columns for a user, creating the row if it doesn't exist.
 
+        Args:
+            user_id: User's UUID
+            **values: Columns to set
+
+        Returns:
+            Updated UserSettingsModel
+        """
+        # Single atomic upsert on the unique user_id; replaces the
+        # SELECT (+ INSERT) + UPDATE + refresh round trips. updated_at is
+        # set by the database clock, like the created_at/updated_at defaults
+        stmt = (
+            pg_insert(UserSettingsModel)
+            .values(user_id=user_id, **values)
+            .on_conflict_do_update(
+                index_elements=[UserSettingsModel.user_id],
+                set_={**values, "updated_at": UTC_NOW},
+            )
+            .returning(UserSettingsModel)
+            .execution_options(populate_existing=True)
+        )
+
+        settings = self.db.scalars(stmt).one()
         self.db.commit()
-        self.db.refresh(settings)
         return settings
@@ -2,10 +2,73 @@
 Claude AI service - Anthropic API integration.
 Part of Infrastructure layer.
 """
-import httpx
-import json
+import orjson
+from types import MappingProxyType
 from typing import List, Dict, Optional, AsyncIterator, Any
 from app.core.config import settings
+from app.infrastructure.services.http_client import get_http_client
+
+
+# Request headers shared by every ClaudeService; only the API key varies
+_BASE_HEADERS = MappingProxyType({
+    "anthropic-version": "2023-06-01",
+    "content-type": "application/json",
+})
+
+# System prompt per conversation mode, built once at import
+_SYSTEM_PROMPTS = {
+    "chat": """Je bent PAI, een slimme Nederlandse persoonlijke assistent.
+
+Je helpt met:
+- Agenda beheer via Google/Microsoft Calendar
+- Notities maken en organiseren
+- Documenten scannen en verwerken
+- Algemene vragen beantwoorden
+
+KRITIEKE REGELS VOOR ACTIES:
+- Als de gebruiker een afspraak, meeting, evenement of herinnering wil maken: VERPLICHT gebruik de 'create_calendar_event' of 'create_reminder' tool
+- NOOIT een fake success message geven zonder daadwerkelijk een tool uit te voeren
+- Als je niet 100% zeker weet wat de gebruiker bedoelt: VRAAG OM VERDUIDELIJKING, voer GEEN actie uit
+- Als datums/tijden onduidelijk zijn: VRAAG SPECIFIEK naar datum en tijd voordat je de tool gebruikt
+- Gebruik de tools ALTIJD voor agenda-gerelateerde acties, ongeacht of de gebruiker een # commando gebruikt of niet
+
+Andere regels:
+- Antwoord altijd in het Nederlands tenzij gevraagd anders
+- Wees vriendelijk, behulpzaam en to-the-point
+- Als iets onduidelijk is, stel dan verduidelijkende vragen
+
+Beschikbare commando's (optioneel):
+- #calendar - Voor afspraken en agenda
+- #note - Voor notities maken
+- #scan - Voor documenten scannen
+""",
+    "voice": """Je bent PAI, een slimme Nederlandse spraakassistent.
+
+Optimaliseer antwoorden voor spraak:
+- Korte, duidelijke zinnen
+- Geen opsommingen met bullets
+- Gebruik natuurlijke taal
+- Vraag om bevestiging bij belangrijke acties
+
+Je helpt met agenda, notities, documenten en algemene vragen.
+""",
+    "note": """Je bent PAI in notitie-modus.
+
+Help gebruikers met:
+- Notities structureren en organiseren
+- Belangrijke punten samenvatten
+- Tags en categorieën voorstellen
+- Actiepunten identificeren
+""",
+    "scan": """Je bent PAI in scan-modus.
+
+Help gebruikers met:
+- Documenten analyseren
+- Tekst extraheren en structureren
+- Belangrijke informatie identificeren
+- Samenvatten van gescande content
+""",
+}
 
 
 class ClaudeService:
@@ -23,11 +86,7 @@ class ClaudeService:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not configured")
 
-        self.headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01",
-            "content-type": "application/json",
-        }
+        self.headers = {**_BASE_HEADERS, "x-api-key": self.api_key}
 
     def get_calendar_tools(self) -> List[Dict[str, Any]]:
         """
@@ -133,19 +192,20 @@ class ClaudeService:
         if system_prompt:
             body["system"] = system_prompt
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                self.API_URL,
-                headers=self.headers,
-                json=body,
-            )
+        client = get_http_client()
+        response = await client.post(
+            self.API_URL,
+            headers=self.headers,
+            json=body,
+            timeout=60.0,
+        )
 
-            if response.status_code != 200:
-                error_detail = response.text
-                raise Exception(f"Claude API error ({response.status_code}): {error_detail}")
+        if response.status_code != 200:
+            error_detail = response.text
+            raise Exception(f"Claude API error ({response.status_code}): {error_detail}")
 
-            data = response.json()
-            return data
+        data = response.json()
+        return data
 
     async def send_message_stream(
         self,
@@ -187,94 +247,108 @@ class ClaudeService:
         if tools:
             body["tools"] = tools
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            async with client.stream(
-                "POST",
-                self.API_URL,
-                headers=self.headers,
-                json=body,
-            ) as response:
-                if response.status_code != 200:
-                    error_detail = await response.aread()
-                    raise Exception(f"Claude API error ({response.status_code}): {error_detail.decode()}")
-
-                # Parse SSE stream
-                current_tool_use = None
-
-                async for line in response.aiter_lines():
-                    if not line:
-                        continue
+        client = get_http_client()
+        async with client.stream(
+            "POST",
+            self.API_URL,
+            headers=self.headers,
+            json=body,
+            timeout=60.0,
+        ) as response:
+            if response.status_code != 200:
+                error_detail = await response.aread()
+                raise Exception(f"Claude API error ({response.status_code}): {error_detail.decode()}")
 
-                    # Skip comments and empty lines
-                    if line.startswith(":") or not line.strip():
-                        continue
+            # Parse SSE stream
+            current_tool_use = None
 
-                    # Parse SSE format: "event: xxx" and "data: xxx"
-                    if line.startswith("event:"):
-                        continue
+            # Split the byte stream into lines here rather than with
+            # aiter_lines(): orjson parses bytes, so lines are never decoded
+            buffer = bytearray()
+            stream_done = False
 
-                    if line.startswith("data:"):
-                        data_str = line[5:].strip()
+            async for chunk in response.aiter_bytes():
+                buffer += chunk
 
-                        # Skip ping events
-                        if data_str == "[DONE]":
-                            break
+                while True:
+                    end = buffer.find(b"\n")
+                    if end == -1:
+                        break
 
-                        try:
-                            event_data = json.loads(data_str)
-
-                            # Handle different event types
-                            event_type = event_data.get("type")
-
-                            if event_type == "content_block_start":
-                                # Start of a new content block
-                                content_block = event_data.get("content_block", {})
-                                if content_block.get("type") == "tool_use":
-                                    # Start collecting tool use data
-                                    current_tool_use = {
-                                        "id": content_block.get("id"),
-                                        "name": content_block.get("name"),
-                                        "input": ""
-                                    }
-
-                            elif event_type == "content_block_delta":
-                                delta = event_data.get("delta", {})
-
-                                if delta.get("type") == "text_delta":
-                                    # Regular text response
-                                    text = delta.get("text", "")
-                                    if text:
-                                        yield {"type": "text", "text": text}
-
-                                elif delta.get("type") == "input_json_delta":
-                                    # Tool input being streamed
-                                    if current_tool_use:
-                                        current_tool_use["input"] += delta.get("partial_json", "")
-
-                            elif event_type == "content_block_stop":
-                                # End of content block
+                    line = bytes(buffer[:end])
+                    del buffer[:end + 1]
+
+                    # Only data lines carry events; event:, comment and blank
+                    # lines all fail this single check
+                    if not line.startswith(b"data:"):
+                        continue
+
+                    data = line[5:].strip()
+
+                    # Skip ping events
+                    if data == b"[DONE]":
+                        stream_done = True
+                        break
+
+                    try:
+                        event_data = orjson.loads(data)
+
+                        # Handle different event types
+                        event_type = event_data.get("type")
+
+                        if event_type == "content_block_start":
+                            # Start of a new content block
+                            content_block = event_data.get("content_block", {})
+                            if content_block.get("type") == "tool_use":
+                                # Start collecting tool use data
+                                current_tool_use = {
+                                    "id": content_block.get("id"),
+                                    "name": content_block.get("name"),
+                                    "input": ""
+                                }
+
+                        elif event_type == "content_block_delta":
+                            delta = event_data.get("delta", {})
+
+                            if delta.get("type") == "text_delta":
+                                # Regular text response
+                                text = delta.get("text", "")
+                                if text:
+                                    yield {"type": "text", "text": text}
+
+                            elif delta.get("type") == "input_json_delta":
+                                # Tool input being streamed
                                 if current_tool_use:
-                                    # Parse complete tool input
-                                    try:
-                                        current_tool_use["input"] = json.loads(current_tool_use["input"])
-                                    except json.JSONDecodeError:
-                                        pass
-
-                                    # Yield complete tool use
-                                    yield {
-                                        "type": "tool_use",
-                                        "id": current_tool_use["id"],
-                                        "name": current_tool_use["name"],
-                                        "input": current_tool_use["input"]
-                                    }
-                                    current_tool_use = None
-
-                            elif event_type == "message_stop":
-                                break
-
-                        except json.JSONDecodeError:
-                            # Skip malformed JSON
-                            continue
+                                    current_tool_use["input"] += delta.get("partial_json", "")
+
+                        elif event_type == "content_block_stop":
+                            # End of content block
+                            if current_tool_use:
+                                # Parse complete tool input
+                                try:
+                                    current_tool_use["input"] = orjson.loads(current_tool_use["input"])
+                                except orjson.JSONDecodeError:
+                                    pass
+
+                                # Yield complete tool use
+                                yield {
+                                    "type": "tool_use",
+                                    "id": current_tool_use["id"],
+                                    "name": current_tool_use["name"],
+                                    "input": current_tool_use["input"]
+                                }
+                                current_tool_use = None
+
+                        elif event_type == "message_stop":
+                            stream_done = True
+                            break
+
+                    except orjson.JSONDecodeError:
+                        # Skip malformed JSON
+                        continue
+
+                if stream_done:
+                    break
 
     def get_system_prompt(self, mode: str = "chat") -> str:
         """
@@ -286,58 +360,4 @@ class ClaudeService:
         Returns:
             System prompt string
         """
-        prompts = {
-            "chat": """Je bent PAI, een slimme Nederlandse persoonlijke assistent.
-
-Je helpt met:
-- Agenda beheer via Google/Microsoft Calendar
-- Notities maken en organiseren
-- Documenten scannen en verwerken
-- Algemene vragen beantwoorden
-
-KRITIEKE REGELS VOOR ACTIES:
-- Als de gebruiker een afspraak, meeting, evenement of herinnering wil maken: VERPLICHT gebruik de 'create_calendar_event' of 'create_reminder' tool
-- NOOIT een fake success message geven zonder daadwerkelijk een tool uit te voeren
-- Als je niet 100% zeker weet wat de gebruiker bedoelt: VRAAG OM VERDUIDELIJKING, voer GEEN actie uit
-- Als datums/tijden onduidelijk zijn: VRAAG SPECIFIEK naar datum en tijd voordat je de tool gebruikt
-- Gebruik de tools ALTIJD voor agenda-gerelateerde acties, ongeacht of de gebruiker een # commando gebruikt of niet
-
-Andere regels:
-- Antwoord altijd in het Nederlands tenzij gevraagd anders
-- Wees vriendelijk, behulpzaam en to-the-point
-- Als iets onduidelijk is, stel dan verduidelijkende vragen
-
-Beschikbare commando's (optioneel):
-- #calendar - Voor afspraken en agenda
-- #note - Voor notities maken
-- #scan - Voor documenten scannen
-""",
-            "voice": """Je bent PAI, een slimme Nederlandse spraakassistent.
-
-Optimaliseer antwoorden voor spraak:
-- Korte, duidelijke zinnen
-- Geen opsommingen met bullets
-- Gebruik natuurlijke taal
-- Vraag om bevestiging bij belangrijke acties
-
-Je helpt met agenda, notities, documenten en algemene vragen.
-""",
-            "note": """Je bent PAI in notitie-modus.
-
-Help gebruikers met:
-- Notities structureren en organiseren
-- Belangrijke punten samenvatten
-- Tags en categorieën voorstellen
-- Actiepunten identificeren
-""",
-            "scan": """Je bent PAI in scan-modus.
-
-Help gebruikers met:
-- Documenten analyseren
-- Tekst extraheren en structureren
-- Belangrijke informatie identificeren
-- Samenvatten van gescande content
-""",
-        }
-
-        return prompts.get(mode, prompts["chat"])
+        return _SYSTEM_PROMPTS.get(mode, _SYSTEM_PROMPTS["chat"])
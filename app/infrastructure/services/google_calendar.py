@@ -2,10 +2,31 @@
 Google Calendar API service.
 Part of Infrastructure layer.
 """
-import httpx
+import orjson
 from typing import Optional
 from datetime import datetime
-from app.domain.entities.calendar_event import CalendarEvent
+from app.domain.entities.calendar_event import CalendarEvent, DEFAULT_TIMEZONE
+from app.infrastructure.services.http_client import get_http_client
+
+
+def _event_to_body(event: CalendarEvent, timezone: str) -> dict:
+    """Build the Calendar API request body for an event."""
+    body = {
+        "summary": event.title,
+        "start": {"dateTime": event.start_time.isoformat(), "timeZone": timezone},
+        "end": {"dateTime": event.end_time.isoformat(), "timeZone": timezone},
+    }
+
+    if event.description:
+        body["description"] = event.description
+
+    if event.location:
+        body["location"] = event.location
+
+    if event.attendees:
+        body["attendees"] = [{"email": email} for email in event.attendees]
+
+    return body
 
 
 class GoogleCalendarService:
@@ -15,9 +36,12 @@ class GoogleCalendarService:
     """
 
     BASE_URL = "https://www.googleapis.com/calendar/v3"
+    # Partial response: only the event fields _parse_event reads
+    EVENT_FIELDS = "id,summary,description,start,end,location,attendees/email"
 
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, timezone: Optional[str] = None):
         self.access_token = access_token
+        self.timezone = timezone or DEFAULT_TIMEZONE
         self.headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
@@ -27,14 +51,14 @@ class GoogleCalendarService:
         """List all calendars for the authenticated user."""
         url = f"{self.BASE_URL}/users/me/calendarList"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
+        client = get_http_client()
+        response = await client.get(url, headers=self.headers)
 
-            if response.status_code != 200:
-                raise Exception(f"Failed to list calendars: {response.text}")
+        if response.status_code != 200:
+            raise Exception(f"Failed to list calendars: {response.text}")
 
-            data = response.json()
-            return data.get("items", [])
+        data = response.json()
+        return data.get("items", [])
 
     async def list_events(
         self,
@@ -49,26 +73,27 @@ class GoogleCalendarService:
             "maxResults": max_results,
             "singleEvents": "true",
             "orderBy": "startTime",
+            "fields": f"items({self.EVENT_FIELDS})",
         }
 
         if time_min:
             params["timeMin"] = time_min.isoformat() + "Z"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
+        client = get_http_client()
+        response = await client.get(url, headers=self.headers, params=params)
 
-            if response.status_code != 200:
-                raise Exception(f"Failed to list events: {response.text}")
+        if response.status_code != 200:
+            raise Exception(f"Failed to list events: {response.text}")
 
-            data = response.json()
-            events = []
+        data = orjson.loads(response.content)
+        events = []
 
-            for item in data.get("items", []):
-                event = self._parse_event(item, calendar_id)
-                if event:
-                    events.append(event)
+        for item in data.get("items", []):
+            event = self._parse_event(item, calendar_id)
+            if event:
+                events.append(event)
 
-            return events
+        return events
 
     async def create_event(
         self,
@@ -78,35 +103,18 @@ class GoogleCalendarService:
         """Create a new calendar event."""
         url = f"{self.BASE_URL}/calendars/{calendar_id}/events"
 
-        body = {
-            "summary": event.title,
-            "start": {
-                "dateTime": event.start_time.isoformat(),
-                "timeZone": "Europe/Amsterdam",
-            },
-            "end": {
-                "dateTime": event.end_time.isoformat(),
-                "timeZone": "Europe/Amsterdam",
-            },
-        }
+        body = _event_to_body(event, self.timezone)
 
-        if event.description:
-            body["description"] = event.description
+        client = get_http_client()
+        response = await client.post(
+            url, headers=self.headers, params={"fields": self.EVENT_FIELDS}, json=body
+        )
 
-        if event.location:
-            body["location"] = event.location
+        if response.status_code not in [200, 201]:
+            raise Exception(f"Failed to create event: {response.text}")
 
-        if event.attendees:
-            body["attendees"] = [{"email": email} for email in event.attendees]
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=self.headers, json=body)
-
-            if response.status_code not in [200, 201]:
-                raise Exception(f"Failed to create event: {response.text}")
-
-            data = response.json()
-            return self._parse_event(data, calendar_id)
+        data = response.json()
+        return self._parse_event(data, calendar_id)
 
     async def update_event(
         self,
@@ -117,32 +125,18 @@ class GoogleCalendarService:
         """Update an existing calendar event."""
         url = f"{self.BASE_URL}/calendars/{calendar_id}/events/{event_id}"
 
-        body = {
-            "summary": event.title,
-            "start": {
-                "dateTime": event.start_time.isoformat(),
-                "timeZone": "Europe/Amsterdam",
-            },
-            "end": {
-                "dateTime": event.end_time.isoformat(),
-                "timeZone": "Europe/Amsterdam",
-            },
-        }
-
-        if event.description:
-            body["description"] = event.description
-
-        if event.location:
-            body["location"] = event.location
+        body = _event_to_body(event, self.timezone)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.put(url, headers=self.headers, json=body)
+        client = get_http_client()
+        response = await client.put(
+            url, headers=self.headers, params={"fields": self.EVENT_FIELDS}, json=body
+        )
 
-            if response.status_code != 200:
-                raise Exception(f"Failed to update event: {response.text}")
+        if response.status_code != 200:
+            raise Exception(f"Failed to update event: {response.text}")
 
-            data = response.json()
-            return self._parse_event(data, calendar_id)
+        data = response.json()
+        return self._parse_event(data, calendar_id)
 
     async def delete_event(
         self,
@@ -152,10 +146,10 @@ class GoogleCalendarService:
         """Delete a calendar event."""
         url = f"{self.BASE_URL}/calendars/{calendar_id}/events/{event_id}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url, headers=self.headers)
+        client = get_http_client()
+        response = await client.delete(url, headers=self.headers)
 
-            return response.status_code == 204
+        return response.status_code == 204
 
     def _parse_event(self, data: dict, calendar_id: str) -> Optional[CalendarEvent]:
         """Parse Google Calendar event data to domain entity."""
@@ -166,8 +160,9 @@ class GoogleCalendarService:
 
             # Handle dateTime vs date (all-day events)
             if "dateTime" in start:
-                start_time = datetime.fromisoformat(start["dateTime"].replace("Z", "+00:00"))
-                end_time = datetime.fromisoformat(end["dateTime"].replace("Z", "+00:00"))
+                # fromisoformat accepts the trailing "Z" since Python 3.11
+                start_time = datetime.fromisoformat(start["dateTime"])
+                end_time = datetime.fromisoformat(end["dateTime"])
                 is_all_day = False
             else:
                 # All-day event
@@ -176,9 +171,7 @@ class GoogleCalendarService:
                 is_all_day = True
 
             # Parse attendees
-            attendees = []
-            for attendee in data.get("attendees", []):
-                attendees.append(attendee.get("email"))
+            attendees = [attendee.get("email") for attendee in data.get("attendees", [])]
 
             return CalendarEvent(
                 id=data.get("id"),
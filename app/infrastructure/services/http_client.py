@@ -0,0 +1,29 @@
+"""
+Shared outbound HTTP client.
+Part of Infrastructure layer.
+"""
+from typing import Optional
+
+import httpx
+
+# One pooled client for all external APIs (Anthropic, Google, Microsoft), so
+# TCP/TLS connections are kept alive between requests instead of being set
+# up and torn down for every call; HTTP/2 lets concurrent requests to the
+# same host share one connection
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(http2=True)
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -3,13 +3,23 @@ JWT token service for authentication.
 Part of Infrastructure layer.
 """
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from uuid import UUID
 import secrets
+import time
 from jose import JWTError, jwt
 from app.core.config import settings
 
 
+# Short-lived cache of verified access tokens: token -> (user_id, cache_expiry).
+# Bursts of requests from one client reuse the same token, so this skips the
+# signature check for all but the first request. Entries never outlive the
+# token's own "exp" claim.
+_TOKEN_CACHE_TTL_SECONDS = 60
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: Dict[str, Tuple[UUID, float]] = {}
+
+
 def create_access_token(user_id: UUID, email: str, provider: str) -> str:
     """
     Create a JWT access token for a user.
@@ -62,15 +72,33 @@ def extract_user_id_from_token(token: str) -> Optional[UUID]:
     Returns:
         User UUID if valid, None otherwise
     """
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        if cached[1] > now:
+            return cached[0]
+        del _token_cache[token]
+
     payload = decode_access_token(token)
     if payload is None:
         return None
 
     try:
-        return UUID(payload.get("sub"))
+        user_id = UUID(payload.get("sub"))
     except (ValueError, TypeError):
         return None
 
+    if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _token_cache[next(iter(_token_cache))]
+    expiry = now + _TOKEN_CACHE_TTL_SECONDS
+    exp_claim = payload.get("exp")
+    if isinstance(exp_claim, (int, float)):
+        expiry = min(expiry, exp_claim)
+    _token_cache[token] = (user_id, expiry)
+
+    return user_id
+
 
 def create_refresh_token() -> Tuple[str, datetime]:
     """
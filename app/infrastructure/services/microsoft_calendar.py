@@ -2,10 +2,10 @@
 Microsoft Calendar API service (Graph API).
 Part of Infrastructure layer.
 """
-import httpx
 from typing import Optional
 from datetime import datetime
-from app.domain.entities.calendar_event import CalendarEvent
+from app.domain.entities.calendar_event import CalendarEvent, DEFAULT_TIMEZONE
+from app.infrastructure.services.http_client import get_http_client
 
 
 class MicrosoftCalendarService:
@@ -16,8 +16,9 @@ class MicrosoftCalendarService:
 
     BASE_URL = "https://graph.microsoft.com/v1.0"
 
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, timezone: Optional[str] = None):
         self.access_token = access_token
+        self.timezone = timezone or DEFAULT_TIMEZONE
         self.headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
@@ -27,14 +28,14 @@ class MicrosoftCalendarService:
         """List all calendars for the authenticated user."""
         url = f"{self.BASE_URL}/me/calendars"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
+        client = get_http_client()
+        response = await client.get(url, headers=self.headers)
 
-            if response.status_code != 200:
-                raise Exception(f"Failed to list calendars: {response.text}")
+        if response.status_code != 200:
+            raise Exception(f"Failed to list calendars: {response.text}")
 
-            data = response.json()
-            return data.get("value", [])
+        data = response.json()
+        return data.get("value", [])
 
     async def list_events(
         self,
@@ -58,21 +59,21 @@ class MicrosoftCalendarService:
             # Filter events starting after time_min
             params["$filter"] = f"start/dateTime ge '{time_min.isoformat()}'"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
+        client = get_http_client()
+        response = await client.get(url, headers=self.headers, params=params)
 
-            if response.status_code != 200:
-                raise Exception(f"Failed to list events: {response.text}")
+        if response.status_code != 200:
+            raise Exception(f"Failed to list events: {response.text}")
 
-            data = response.json()
-            events = []
+        data = response.json()
+        events = []
 
-            for item in data.get("value", []):
-                event = self._parse_event(item)
-                if event:
-                    events.append(event)
+        for item in data.get("value", []):
+            event = self._parse_event(item)
+            if event:
+                events.append(event)
 
-            return events
+        return events
 
     async def create_event(
         self,
@@ -89,11 +90,11 @@ class MicrosoftCalendarService:
             "subject": event.title,
             "start": {
                 "dateTime": event.start_time.isoformat(),
-                "timeZone": "Europe/Amsterdam",
+                "timeZone": self.timezone,
             },
             "end": {
                 "dateTime": event.end_time.isoformat(),
-                "timeZone": "Europe/Amsterdam",
+                "timeZone": self.timezone,
             },
         }
 
@@ -115,14 +116,14 @@ class MicrosoftCalendarService:
                 for email in event.attendees
             ]
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=self.headers, json=body)
+        client = get_http_client()
+        response = await client.post(url, headers=self.headers, json=body)
 
-            if response.status_code not in [200, 201]:
-                raise Exception(f"Failed to create event: {response.text}")
+        if response.status_code not in [200, 201]:
+            raise Exception(f"Failed to create event: {response.text}")
 
-            data = response.json()
-            return self._parse_event(data)
+        data = response.json()
+        return self._parse_event(data)
 
     async def update_event(
         self,
@@ -136,11 +137,11 @@ class MicrosoftCalendarService:
             "subject": event.title,
             "start": {
                 "dateTime": event.start_time.isoformat(),
-                "timeZone": "Europe/Amsterdam",
+                "timeZone": self.timezone,
             },
             "end": {
                 "dateTime": event.end_time.isoformat(),
-                "timeZone": "Europe/Amsterdam",
+                "timeZone": self.timezone,
             },
         }
 
@@ -153,23 +154,23 @@ class MicrosoftCalendarService:
         if event.location:
             body["location"] = {"displayName": event.location}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(url, headers=self.headers, json=body)
+        client = get_http_client()
+        response = await client.patch(url, headers=self.headers, json=body)
 
-            if response.status_code != 200:
-                raise Exception(f"Failed to update event: {response.text}")
+        if response.status_code != 200:
+            raise Exception(f"Failed to update event: {response.text}")
 
-            data = response.json()
-            return self._parse_event(data)
+        data = response.json()
+        return self._parse_event(data)
 
     async def delete_event(self, event_id: str) -> bool:
         """Delete a calendar event."""
         url = f"{self.BASE_URL}/me/events/{event_id}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url, headers=self.headers)
+        client = get_http_client()
+        response = await client.delete(url, headers=self.headers)
 
-            return response.status_code == 204
+        return response.status_code == 204
 
     def _parse_event(self, data: dict) -> Optional[CalendarEvent]:
         """Parse Microsoft Graph event data to domain entity."""
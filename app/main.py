@@ -5,6 +5,7 @@ Clean Architecture implementation with FastAPI
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.infrastructure.services.http_client import close_http_client
 from app.presentation.routers import health, auth, calendar, conversation, monitor, persons, tasks, notes, inbox, mcp, onboarding
 import time
 
@@ -18,13 +19,11 @@ app = FastAPI(
 )
 
 # Configure CORS - Secure configuration for development/production
-# Allows:
-# - localhost with any port (development)
-# - 127.0.0.1 with any port (development)
-# - Tailscale IPs (100.x.x.x) with any port (remote access)
+# Allows localhost, 127.0.0.1 and Tailscale IPs (see app.core.config) plus any
+# explicit ALLOWED_ORIGINS, all matched by one precompiled regex.
 app.add_middleware(
     CORSMiddleware,
-    allow_origin_regex=r"^(http://localhost:\d+|http://127\.0\.0\.1:\d+|https?://100\.\d{1,3}\.\d{1,3}\.\d{1,3}(:\d+)?)$",
+    allow_origin_regex=settings.ALLOWED_ORIGINS_PATTERN,
     allow_credentials=False,  # We use JWT tokens in headers, not cookies
     allow_methods=["*"],
     allow_headers=["*"],
@@ -150,6 +149,7 @@ async def startup_event():
 async def shutdown_event():
     """Actions to perform on application shutdown."""
     print(f"👋 {settings.APP_NAME} shutting down...")
+    await close_http_client()
 
 
 @app.get("/")
@@ -35,7 +35,7 @@ class MessageSendRequest(BaseModel):
 
 class MessageResponse(BaseModel):
     """Message response."""
-    id: str
+    id: UUID
     conversation_id: UUID
     role: str
     content: str
@@ -128,6 +128,8 @@ async def list_conversations(
     mode: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    after_updated_at: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -138,7 +140,15 @@ async def list_conversations(
     - mode: Filter by mode (chat, voice, note, scan)
     - limit: Max results (default 50)
     - offset: Pagination offset
+    - after_updated_at/after_id: Keyset cursor from the last conversation
+      received; preferred over offset for the next page
     """
+    if (after_updated_at is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_updated_at and after_id must be provided together",
+        )
+
     try:
         use_cases = ConversationUseCases(db)
         conversations = use_cases.get_user_conversations(
@@ -146,6 +156,7 @@ async def list_conversations(
             mode=mode,
             limit=limit,
             offset=offset,
+            after=(after_updated_at, after_id) if after_id else None,
         )
 
         return [
@@ -389,10 +400,23 @@ async def get_messages(
     conversation_id: UUID,
     limit: int = 100,
     offset: int = 0,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Get messages from a conversation with pagination."""
+    """
+    Get messages from a conversation with pagination.
+
+    For the next page, pass the created_at and id of the last message received
+    as after_created_at/after_id (keyset pagination) instead of an offset.
+    """
+    if (after_created_at is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_created_at and after_id must be provided together",
+        )
+
     try:
         use_cases = ConversationUseCases(db)
         messages = use_cases.get_messages(
@@ -400,6 +424,7 @@ async def get_messages(
             user_id=current_user["id"],
             limit=limit,
             offset=offset,
+            after=(after_created_at, after_id) if after_id else None,
         )
 
         return [
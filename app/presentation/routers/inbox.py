@@ -28,6 +28,11 @@ class InboxItemCreateRequest(BaseModel):
     priority: str = Field("medium", pattern="^(low|medium|high|urgent)$")
 
 
+class InboxItemBatchCreateRequest(BaseModel):
+    """Request to create many inbox items at once."""
+    items: List[InboxItemCreateRequest] = Field(..., min_length=1, max_length=1000)
+
+
 class InboxItemModifyRequest(BaseModel):
     """Request to modify and accept an inbox item."""
     action: str = Field(..., pattern="^(create_task|create_note|archive|delegate)$")
@@ -112,6 +117,44 @@ def create_inbox_item(
         )
 
 
+@router.post("/batch", response_model=List[InboxItemResponse], status_code=status.HTTP_201_CREATED)
+def create_inbox_items(
+    request: InboxItemBatchCreateRequest,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Create many inbox items in one request (e.g. a mail sync).
+    All items are validated first and inserted in a single statement.
+    """
+    try:
+        from app.domain.entities.inbox_item import InboxItemType, Priority
+
+        use_cases = InboxUseCases(db)
+        items = use_cases.create_inbox_items(
+            user_id=UUID(current_user["id"]),
+            items=[
+                {
+                    "type": InboxItemType(item.type),
+                    "source": item.source,
+                    "subject": item.subject,
+                    "content": item.content,
+                    "raw_data": item.raw_data,
+                    "priority": Priority(item.priority),
+                }
+                for item in request.items
+            ],
+        )
+        return items
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create inbox items: {str(e)}",
+        )
+
+
 @router.get("", response_model=InboxListResponse)
 def list_inbox_items(
     status_filter: Optional[str] = None,
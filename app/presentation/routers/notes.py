@@ -5,6 +5,7 @@ Part of Presentation layer.
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import Optional, List
+from datetime import datetime
 from pydantic import BaseModel, Field
 from uuid import UUID
 
@@ -128,7 +129,8 @@ class NoteResponse(BaseModel):
 class NoteListResponse(BaseModel):
     """List of notes."""
     notes: List[NoteResponse]
-    total: int
+    total: int  # Notes in this page
+    has_more: bool = False
 
 
 # ==================== Note Group Endpoints ====================
@@ -315,10 +317,20 @@ def list_notes(
     include_deleted: bool = Query(False, description="Include soft-deleted notes"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
+    after_pinned: Optional[bool] = Query(None, description="Keyset cursor: is_pinned of the last note received"),
+    after_updated_at: Optional[datetime] = Query(None, description="Keyset cursor: updated_at of the last note received"),
+    after_id: Optional[UUID] = Query(None, description="Keyset cursor: id of the last note received"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
     """List notes for the current user."""
+    cursor = (after_pinned, after_updated_at, after_id)
+    if any(c is not None for c in cursor) and not all(c is not None for c in cursor):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_pinned, after_updated_at and after_id must be provided together",
+        )
+
     try:
         use_cases = NoteUseCases(db)
         notes = use_cases.list_notes(
@@ -326,14 +338,14 @@ def list_notes(
             group_id=UUID(group_id) if group_id else None,
             include_deleted=include_deleted,
             search=search,
-            limit=limit,
+            # One extra row tells whether another page exists without a COUNT(*)
+            limit=limit + 1,
             offset=skip,
+            after=cursor if after_id else None,
         )
-        total = use_cases.get_note_count(
-            user_id=UUID(current_user["id"]),
-            include_deleted=include_deleted,
-        )
-        return {"notes": notes, "total": total}
+        has_more = len(notes) > limit
+        notes = notes[:limit]
+        return {"notes": notes, "total": len(notes), "has_more": has_more}
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -77,18 +77,30 @@ def create_person(
 def list_persons(
     limit: int = 100,
     offset: int = 0,
+    after_name: Optional[str] = None,
+    after_id: Optional[UUID] = None,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
     """
     List all persons for the current user.
+
+    For the next page, pass the name and id of the last person received
+    as after_name/after_id (keyset pagination) instead of an offset.
     """
+    if (after_name is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_name and after_id must be provided together",
+        )
+
     try:
         use_cases = PersonUseCases(db)
         persons = use_cases.list_persons(
             user_id=UUID(current_user["id"]),
             limit=limit,
             offset=offset,
+            after=(after_name, after_id) if after_id else None,
         )
         return persons
     except Exception as e:
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from typing import Optional, List
 from pydantic import BaseModel, Field
 from uuid import UUID
+from datetime import datetime
 
 from app.core.dependencies import get_db, get_current_user
 from app.application.use_cases.task_use_cases import TaskUseCases
@@ -110,12 +111,23 @@ def list_tasks(
     tag: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
+    after_updated_at: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
     """
     List tasks for the current user with optional filters.
+
+    For the next page, pass the updated_at and id of the last task received
+    as after_updated_at/after_id (keyset pagination) instead of an offset.
     """
+    if (after_updated_at is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_updated_at and after_id must be provided together",
+        )
+
     try:
         use_cases = TaskUseCases(db)
         tasks = use_cases.list_tasks(
@@ -126,6 +138,7 @@ def list_tasks(
             tag=tag,
             limit=limit,
             offset=offset,
+            after=(after_updated_at, after_id) if after_id else None,
         )
         return tasks
     except Exception as e:
@@ -218,6 +231,35 @@ def get_task_by_number(
         )
 
 
+@router.get("/formatted/{formatted_id}", response_model=TaskResponse)
+def get_task_by_formatted_id(
+    formatted_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Get a task by formatted ID (e.g. Task-00000042).
+    """
+    try:
+        use_cases = TaskUseCases(db)
+        task = use_cases.get_task_by_formatted_id(formatted_id, UUID(current_user["id"]))
+
+        if not task:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found",
+            )
+
+        return task
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get task: {str(e)}",
+        )
+
+
 @router.patch("/{task_id}/status", response_model=TaskResponse)
 def update_task_status(
     task_id: UUID,
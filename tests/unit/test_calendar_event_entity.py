@@ -0,0 +1,80 @@
+"""
+Unit tests for CalendarEvent domain entity.
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from app.domain.entities.calendar_event import CalendarEvent
+
+
+def test_create_event():
+    """Test creating a calendar event."""
+    start = datetime.utcnow() + timedelta(hours=1)
+    event = CalendarEvent.create(
+        title="  Meeting  ",
+        start_time=start,
+        end_time=start + timedelta(minutes=30),
+        provider="google",
+    )
+
+    assert event.title == "Meeting"
+    assert event.attendees == []
+    assert event.duration_minutes() == 30
+
+
+def test_create_event_invalid_provider():
+    """Test that invalid provider raises ValueError."""
+    start = datetime.utcnow()
+    with pytest.raises(ValueError, match="Invalid provider"):
+        CalendarEvent.create(
+            title="Meeting",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            provider="invalid",
+        )
+
+
+def test_create_event_end_before_start():
+    """Test that end time before start time raises ValueError."""
+    start = datetime.utcnow()
+    with pytest.raises(ValueError, match="End time must be after start time"):
+        CalendarEvent.create(
+            title="Meeting",
+            start_time=start,
+            end_time=start - timedelta(hours=1),
+            provider="google",
+        )
+
+
+def test_time_checks_naive_utc():
+    """Test future/past/ongoing checks for naive UTC datetimes."""
+    now = datetime.utcnow()
+    future = CalendarEvent.create("Future", now + timedelta(hours=1), now + timedelta(hours=2), "google")
+    past = CalendarEvent.create("Past", now - timedelta(hours=2), now - timedelta(hours=1), "google")
+    ongoing = CalendarEvent.create("Now", now - timedelta(hours=1), now + timedelta(hours=1), "google")
+
+    assert future.is_in_future() and not future.is_in_past() and not future.is_ongoing()
+    assert past.is_in_past() and not past.is_in_future() and not past.is_ongoing()
+    assert ongoing.is_ongoing() and not ongoing.is_in_future() and not ongoing.is_in_past()
+
+
+def test_time_checks_timezone_aware():
+    """Test that provider datetimes with an offset are compared correctly."""
+    tz = timezone(timedelta(hours=2))
+    now = datetime.now(tz)
+    event = CalendarEvent.create("Aware", now + timedelta(hours=1), now + timedelta(hours=2), "microsoft")
+
+    assert event.is_in_future() is True
+    assert event.is_ongoing() is False
+
+
+def test_time_checks_follow_reassigned_times():
+    """Test that reassigning start/end times updates the time checks."""
+    now = datetime.utcnow()
+    event = CalendarEvent.create("Moved", now + timedelta(hours=1), now + timedelta(hours=2), "google")
+
+    event.start_time = now - timedelta(hours=2)
+    event.end_time = now - timedelta(hours=1)
+
+    assert event.is_in_past() is True
+    assert event.is_in_future() is False
+    assert event.is_ongoing() is False
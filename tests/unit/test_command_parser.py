@@ -0,0 +1,181 @@
+"""
+Unit tests for CommandParser domain service.
+"""
+import pytest
+from app.domain.services.command_parser import CommandParser, CommandType
+
+
+def test_parse_plain_text_is_not_command():
+    """Test that text without prefix is not a command."""
+    parsed = CommandParser.parse("  hallo Pepper  ")
+
+    assert parsed.command_type == CommandType.UNKNOWN
+    assert parsed.is_command() is False
+    assert parsed.original_text == "hallo Pepper"
+    assert parsed.command_text == ""
+    assert parsed.parameters == {}
+
+
+def test_parse_empty_text_is_shared_unknown():
+    """Test that empty input returns the shared empty result."""
+    parsed = CommandParser.parse("   ")
+
+    assert parsed is CommandParser.parse("")
+    assert parsed.command_type == CommandType.UNKNOWN
+    assert parsed.original_text == ""
+    assert parsed.parameters == {}
+
+
+def test_command_type_is_str():
+    """Test that command types compare and hash like their string values."""
+    assert CommandType.CALENDAR == "calendar"
+    assert {"task": 1}[CommandType.TASK] == 1
+
+
+def test_parse_unknown_command():
+    """Test that an unknown keyword is not a command."""
+    parsed = CommandParser.parse("#foo bar")
+
+    assert parsed.command_type == CommandType.UNKNOWN
+    assert parsed.is_command() is False
+    assert parsed.parameters == {"raw_text": "bar"}
+
+
+def test_parse_command_without_text():
+    """Test parsing a bare command keyword."""
+    parsed = CommandParser.parse("#Help")
+
+    assert parsed.command_type == CommandType.HELP
+    assert parsed.command_text == ""
+    assert parsed.parameters == {"raw_text": "", "topic": None}
+
+
+@pytest.mark.parametrize("text,command_type,command_text", [
+    ("#note  boodschappen", CommandType.NOTE, "boodschappen"),
+    ("#note\tmelk brood", CommandType.NOTE, "melk brood"),
+    ("#note\nmelk\nbrood", CommandType.NOTE, "melk\nbrood"),
+    ("#foo1 bar", CommandType.UNKNOWN, "bar"),
+])
+def test_parse_command_word_separators(text, command_type, command_text):
+    """Test that any whitespace separates the command word from its text."""
+    parsed = CommandParser.parse(text)
+
+    assert parsed.command_type == command_type
+    assert parsed.command_text == command_text
+
+
+@pytest.mark.parametrize("text,action,time_context", [
+    ("#calendar afspraak maken morgen om 14:00", "create", "tomorrow"),
+    ("#agenda lijst deze week", "list", "this_week"),
+    ("#cal Vandaag", "today", "today"),
+    ("#calendar morgen", "tomorrow", "tomorrow"),
+    ("#calendar verwijder afspraak 123", "create", None),
+    ("#calendar delete 123", "delete", None),
+    ("#calendar iets anders", "unknown", None),
+])
+def test_calendar_params(text, action, time_context):
+    """Test calendar action and time context detection."""
+    parsed = CommandParser.parse(text)
+
+    assert parsed.command_type == CommandType.CALENDAR
+    assert parsed.parameters["action"] == action
+    assert parsed.parameters["time_context"] == time_context
+
+
+def test_reminder_uses_calendar_params():
+    """Test that reminders are parsed like calendar commands."""
+    parsed = CommandParser.parse("#reminder Tandarts morgen 10:00")
+
+    assert parsed.command_type == CommandType.REMINDER
+    assert parsed.parameters["action"] == "tomorrow"
+    assert parsed.parameters["time_context"] == "tomorrow"
+
+
+def test_task_params():
+    """Test task delegation, priority, deadline and tags extraction."""
+    parsed = CommandParser.parse("#taak Website updaten @Maria priority high deadline vrijdag tags urgent,admin")
+
+    assert parsed.command_type == CommandType.TASK
+    assert parsed.parameters["delegated_to"] == "Maria"
+    assert parsed.parameters["priority"] == "high"
+    assert parsed.parameters["due_date"] == "vrijdag"
+    assert parsed.parameters["tags"] == ["urgent", "admin"]
+    assert parsed.parameters["title"] == "Website updaten"
+
+
+def test_task_params_title_only():
+    """Test a task command with only a title."""
+    parsed = CommandParser.parse("#todo Boodschappen doen")
+
+    assert parsed.command_type == CommandType.TASK
+    assert parsed.parameters == {"raw_text": "Boodschappen doen", "title": "Boodschappen doen"}
+
+
+@pytest.mark.parametrize("text,action", [
+    ("#note maak boodschappenlijst", "create"),
+    ("#notitie Toon alles", "list"),
+    ("#note zoek vergadering", "search"),
+    ("#note iets", "unknown"),
+])
+def test_note_params(text, action):
+    """Test note action detection."""
+    parsed = CommandParser.parse(text)
+
+    assert parsed.command_type == CommandType.NOTE
+    assert parsed.parameters["action"] == action
+
+
+@pytest.mark.parametrize("text,scan_type", [
+    ("#scan bon voor declaratie", "receipt"),
+    ("#scan FOTO", "image"),
+    ("#scan contract.pdf", "document"),
+    ("#scan", "document"),
+])
+def test_scan_params(text, scan_type):
+    """Test scan type detection."""
+    parsed = CommandParser.parse(text)
+
+    assert parsed.command_type == CommandType.SCAN
+    assert parsed.parameters["scan_type"] == scan_type
+
+
+@pytest.mark.parametrize("text,topic", [
+    ("#help calendar", CommandType.CALENDAR),
+    ("#hulp Taak", CommandType.TASK),
+    ("#help over notitie en scan", CommandType.NOTE),
+    ("#help", None),
+])
+def test_help_params(text, topic):
+    """Test help topic detection."""
+    parsed = CommandParser.parse(text)
+
+    assert parsed.command_type == CommandType.HELP
+    assert parsed.parameters["topic"] == topic
+
+
+def test_get_help_text():
+    """Test help text lookup per command type."""
+    assert "Calendar commando's" in CommandParser.parse("#calendar").get_help_text()
+    assert "Beschikbare commando's" in CommandParser.parse("#help").get_help_text()
+    assert CommandParser.parse("hallo").get_help_text().startswith("Onbekend commando")
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("#calendar", True),
+    ("   #note x", True),
+    ("hallo #note", False),
+    ("", False),
+])
+def test_is_command(text, expected):
+    """Test the quick command check."""
+    assert CommandParser.is_command(text) is expected
+
+
+def test_parsed_command_is_frozen():
+    """Test that parsed commands cannot be reassigned."""
+    from dataclasses import FrozenInstanceError
+
+    parsed = CommandParser.parse("#task Rapport maken")
+
+    with pytest.raises(FrozenInstanceError):
+        parsed.command_type = CommandType.UNKNOWN
@@ -0,0 +1,44 @@
+"""
+Unit tests for ConversationRepository bulk message inserts.
+"""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.repositories.conversation_repository import ConversationRepository
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with minimal conversations/messages tables."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE conversations (id CHAR(32) PRIMARY KEY, updated_at DATETIME)")
+        conn.exec_driver_sql(
+            "CREATE TABLE messages ("
+            "id CHAR(32) PRIMARY KEY, conversation_id CHAR(32) NOT NULL, "
+            "role VARCHAR(50) NOT NULL, content TEXT NOT NULL, meta JSON, "
+            "created_at DATETIME NOT NULL)"
+        )
+    return engine
+
+
+def test_add_messages_bulk_uses_single_insert(engine):
+    """Test that several messages are sent as one INSERT ... RETURNING, in order."""
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    db = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    messages = [{"role": "user", "content": f"Message {i}"} for i in range(5)]
+
+    created = ConversationRepository(db).add_messages_bulk(uuid4(), messages)
+
+    inserts = [s for s in statements if s.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert [message.content for message in created] == [f"Message {i}" for i in range(5)]
+    db.close()
@@ -0,0 +1,63 @@
+"""
+Unit tests for InboxItem domain entity.
+"""
+import pytest
+from uuid import uuid4
+from app.domain.entities.inbox_item import InboxItem, InboxItemType, InboxStatus
+
+
+def _make_item() -> InboxItem:
+    return InboxItem.create(
+        user_id=uuid4(),
+        type=InboxItemType.EMAIL,
+        source="test@example.com",
+        subject="Test subject",
+    )
+
+
+def test_create_inbox_item():
+    """Test creating an inbox item."""
+    item = _make_item()
+
+    assert item.id is None
+    assert item.status == InboxStatus.UNPROCESSED
+    assert item.is_processed() is False
+
+
+def test_create_inbox_item_requires_subject_or_content():
+    """Test that an item without subject and content raises ValueError."""
+    with pytest.raises(ValueError, match="either subject or content"):
+        InboxItem.create(user_id=uuid4(), type=InboxItemType.MANUAL, source="manual")
+
+
+def test_pending_review_is_not_processed():
+    """Test that an item awaiting review is not processed."""
+    item = _make_item()
+    item.set_ai_suggestion({"action": "create_task"})
+
+    assert item.status == InboxStatus.PENDING_REVIEW
+    assert item.is_processed() is False
+
+
+@pytest.mark.parametrize("status", [
+    InboxStatus.ACCEPTED,
+    InboxStatus.MODIFIED,
+    InboxStatus.REJECTED,
+    InboxStatus.ARCHIVED,
+])
+def test_processed_statuses(status):
+    """Test that final statuses count as processed."""
+    item = _make_item()
+    item.status = status
+
+    assert item.is_processed() is True
+
+
+def test_reject_uses_single_timestamp():
+    """Test that rejecting records one consistent timestamp."""
+    item = _make_item()
+    item.reject(reason="spam")
+
+    assert item.status == InboxStatus.REJECTED
+    assert item.processed_at == item.updated_at
+    assert item.user_decision["timestamp"] == item.processed_at.isoformat()
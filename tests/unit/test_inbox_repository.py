@@ -0,0 +1,52 @@
+"""
+Unit tests for InboxRepository bulk inserts.
+"""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.entities.inbox_item import InboxItem, InboxItemType
+from app.infrastructure.repositories.inbox_repository import InboxRepository
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with a minimal inbox_items table."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE inbox_items ("
+            "id CHAR(32) PRIMARY KEY, user_id CHAR(32) NOT NULL, "
+            "type VARCHAR(50) NOT NULL, source VARCHAR(100) NOT NULL, "
+            "status VARCHAR(50) NOT NULL, priority VARCHAR(20) NOT NULL, "
+            "subject VARCHAR(500), content TEXT, raw_data JSON, ai_suggestion JSON, "
+            "user_decision JSON, linked_items JSON, processed_at DATETIME, "
+            "created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL)"
+        )
+    return engine
+
+
+def test_bulk_create_uses_single_insert(engine):
+    """Test that a multi-row batch is sent as one INSERT ... RETURNING."""
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    db = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    user_id = uuid4()
+    items = [
+        InboxItem.create(user_id=user_id, type=InboxItemType.MESSAGE, source="manual", subject=f"Item {i}")
+        for i in range(5)
+    ]
+
+    created = InboxRepository(db).bulk_create_inbox_items(items)
+
+    inserts = [s for s in statements if s.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert [model.subject for model in created] == [f"Item {i}" for i in range(5)]
+    assert len({model.id for model in created}) == 5
+    db.close()
@@ -71,3 +71,26 @@ def test_extract_user_id_from_invalid_token():
 
     # Should return None for invalid token
     assert extracted_id is None
+
+
+def test_extract_user_id_is_cached():
+    """Test that a verified token is served from the cache."""
+    from app.infrastructure.services import jwt as jwt_service
+
+    user_id = uuid4()
+    token = create_access_token(user_id, "test@example.com", "local")
+
+    assert extract_user_id_from_token(token) == user_id
+    assert token in jwt_service._token_cache
+    assert extract_user_id_from_token(token) == user_id
+
+
+def test_extract_user_id_cache_entry_expires():
+    """Test that an expired cache entry is dropped and the token re-verified."""
+    from app.infrastructure.services import jwt as jwt_service
+
+    token = "invalid.token.here"
+    jwt_service._token_cache[token] = (uuid4(), 0.0)
+
+    assert extract_user_id_from_token(token) is None
+    assert token not in jwt_service._token_cache
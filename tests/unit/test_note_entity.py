@@ -0,0 +1,99 @@
+"""
+Unit tests for Note, NoteItem and NoteGroup domain entities.
+"""
+import sys
+import pytest
+from uuid import uuid4
+from app.domain.entities.note import Note, NoteItem
+from app.domain.entities.note_group import NoteGroup
+
+
+def test_create_note():
+    """Test creating a text note."""
+    note = Note.create(user_id=uuid4(), title="  Shopping  ", content="milk")
+
+    assert note.title == "Shopping"
+    assert note.color == "yellow"
+    assert note.items == []
+    assert note.is_deleted() is False
+
+
+def test_create_note_invalid_color():
+    """Test that invalid color raises ValueError listing valid colors."""
+    with pytest.raises(ValueError, match="Invalid color: brown. Must be one of: blue, gray"):
+        Note.create(user_id=uuid4(), title="Test", color="brown")
+
+
+def test_update_note_color():
+    """Test updating the note color."""
+    note = Note.create(user_id=uuid4(), title="Test")
+    note.update_color("green")
+
+    assert note.color == "green"
+
+    with pytest.raises(ValueError, match="Invalid color"):
+        note.update_color("brown")
+
+
+def test_create_note_group_invalid_color():
+    """Test that invalid group color raises ValueError."""
+    with pytest.raises(ValueError, match="Invalid color: white"):
+        NoteGroup.create(user_id=uuid4(), name="Work", color="white")
+
+
+def test_create_note_item_empty_content():
+    """Test that empty note item content raises ValueError."""
+    with pytest.raises(ValueError, match="cannot be empty"):
+        NoteItem.create(content="   ")
+
+
+def test_soft_delete_and_restore():
+    """Test soft deleting and restoring a note."""
+    note = Note.create(user_id=uuid4(), title="Test")
+    assert note.created_at == note.updated_at
+
+    note.soft_delete()
+    assert note.is_deleted() is True
+    assert note.deleted_at == note.updated_at
+
+    note.restore()
+    assert note.is_deleted() is False
+
+    with pytest.raises(ValueError, match="not deleted"):
+        note.restore()
+
+
+def test_remove_item():
+    """Test removing an item from a checklist note."""
+    first = NoteItem.create(content="milk")
+    first.id = uuid4()
+    second = NoteItem.create(content="bread")
+    second.id = uuid4()
+    note = Note.create(user_id=uuid4(), title="Shopping", is_checklist=True, items=[first, second])
+
+    note.remove_item(first.id)
+    assert note.items == [second]
+
+    note.remove_item(uuid4())
+    assert note.items == [second]
+
+
+def test_note_color_is_interned():
+    """Test that stored colors share the interned string."""
+    color = "".join(["gr", "een"])
+    note = Note.create(user_id=uuid4(), title="Test", color=color)
+
+    assert note.color is sys.intern("green")
+
+
+def test_none_color_raises_value_error():
+    """Test that a missing color raises the domain ValueError, not TypeError."""
+    with pytest.raises(ValueError, match="Invalid color: None"):
+        Note.create(user_id=uuid4(), title="Test", color=None)
+
+    with pytest.raises(ValueError, match="Invalid color: None"):
+        NoteGroup.create(user_id=uuid4(), name="Work", color=None)
+
+    note = Note.create(user_id=uuid4(), title="Test")
+    with pytest.raises(ValueError, match="Invalid color: None"):
+        note.update_color(None)
@@ -0,0 +1,49 @@
+"""
+Unit tests for Person domain entity.
+"""
+import pytest
+from uuid import uuid4
+from app.domain.entities.person import Person
+
+
+def test_create_person():
+    """Test creating a person with contact details."""
+    person = Person.create(
+        user_id=uuid4(),
+        name="  Jan Jansen  ",
+        email=" jan@example.com ",
+        phone_number=" 0612345678 ",
+    )
+
+    assert person.name == "Jan Jansen"
+    assert person.email == "jan@example.com"
+    assert person.phone_number == "0612345678"
+    assert person.created_at == person.updated_at
+
+
+def test_create_person_blank_email_is_none():
+    """Test that a blank email is stored as None."""
+    person = Person.create(user_id=uuid4(), name="Jan", email="   ")
+
+    assert person.email is None
+
+
+@pytest.mark.parametrize("email", ["jan", "jan@example", "jan@@example.com", "jan jansen@example.com"])
+def test_create_person_invalid_email(email):
+    """Test that malformed emails raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid email format"):
+        Person.create(user_id=uuid4(), name="Jan", email=email)
+
+
+def test_update_person_email():
+    """Test updating and clearing the email."""
+    person = Person.create(user_id=uuid4(), name="Jan")
+
+    person.update(email="jan@example.nl")
+    assert person.email == "jan@example.nl"
+
+    with pytest.raises(ValueError, match="Invalid email format"):
+        person.update(email="jan@example")
+
+    person.update(email="")
+    assert person.email is None
@@ -0,0 +1,45 @@
+"""
+Unit tests for PersonRepository updates.
+"""
+import time
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.database.models import PersonModel
+from app.infrastructure.repositories.person_repository import PersonRepository
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session with a minimal persons table."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE persons ("
+            "id CHAR(32) PRIMARY KEY, user_id CHAR(32) NOT NULL, "
+            "name VARCHAR(200) NOT NULL, email VARCHAR(255), phone_number VARCHAR(50), "
+            "created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, "
+            "updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL)"
+        )
+    session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    yield session
+    session.close()
+
+
+def test_update_person_returns_fresh_updated_at(db):
+    """Test that update_person returns the new updated_at for an already loaded row."""
+    person = PersonModel(id=uuid4(), user_id=uuid4(), name="Jan")
+    db.add(person)
+    db.commit()
+
+    repo = PersonRepository(db)
+    before = repo.get_person(person.id).updated_at
+    time.sleep(0.01)
+
+    updated = repo.update_person(person.id, name="Piet")
+
+    assert updated.name == "Piet"
+    assert updated.updated_at > before